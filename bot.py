@@ -50,12 +50,16 @@ print("-" * 60)
 async def run():
     global exposure, total_rebate
     
-    for cycle in range(1, 4):
+    # Draw every cycle's prices up front, one row per cycle
+    rng = random.Random()
+    draws = [[(rng.random(), rng.random()) for _ in MARKETS] for _ in range(3)]
+    
+    for cycle, row in enumerate(draws, 1):
         print(f"\n🔄 Cycle {cycle} | Exp: ${exposure}")
         
-        for mkt in MARKETS:
-            mid = round(random.uniform(0.50, 0.60), 4)
-            bid = round(mid - random.uniform(0.001, 0.005), 4)
+        for mkt, (u_mid, u_off) in zip(MARKETS, row):
+            mid = round(0.50 + u_mid * 0.10, 4)
+            bid = round(mid - (0.001 + u_off * 0.004), 4)
             rebate = order_size * bid * mkt["fee"] / 10000
             
             print(f"   📈 {mkt['t'][0][-6:]}... BUY ${order_size:.0f} @ {bid}")
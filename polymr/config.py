@@ -105,6 +105,9 @@ class AutoRedeemConfig(BaseModel):
     threshold_usd: float = 1.0
     auto_merge_enabled: bool = True
     check_interval_seconds: int = 60
+    max_concurrency: int = 8
+    batch_window_ms: int = 50
+    max_backoff_seconds: int = 600
 
 
 class GasConfig(BaseModel):
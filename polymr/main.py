@@ -244,6 +244,7 @@ class MarketMakerBot:
             await self.order_executor.cancel_all_orders()
 
         # Close connections
+        await self.auto_redeem.close()
         await self.ws_client.disconnect()
         await self.rest_client.close()
 
@@ -271,5 +272,15 @@ async def main():
         sys.exit(1)
 
 
+def install_event_loop() -> None:
+    """Use uvloop's event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
+
 if __name__ == "__main__":
+    install_event_loop()
     asyncio.run(main())
@@ -13,6 +13,7 @@ import logging
 from typing import Any, Dict, List, Optional
 
 import httpx
+import orjson
 from py_clob_client.client import ClobClient
 from py_clob_client.clob_types import OrderArgs, OrderType, TradeParams
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -30,12 +31,18 @@ class PolymarketRESTClient:
     for the maker rebates bot.
     """
 
-    def __init__(self, settings: Settings):
+    def __init__(
+        self,
+        settings: Settings,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """
         Initialize the REST client.
 
         Args:
             settings: Bot settings containing API configuration.
+            http_client: Optional shared HTTP client. When omitted the REST
+                client creates and owns a pooled keep-alive client.
         """
         self.settings = settings
         self.config = settings.polymarket
@@ -52,12 +59,27 @@ class PolymarketRESTClient:
         # Set API credentials
         self.client.set_api_creds(self.client.create_or_derive_api_creds())
 
-        # HTTP client for additional REST calls
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        # HTTP client for additional REST calls, reused for the client's lifetime
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=32,
+                keepalive_expiry=75.0,
+            ),
+        )
+
+    async def __aenter__(self) -> "PolymarketRESTClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.http_client.aclose()
+        """Close the HTTP client if this instance owns it."""
+        if self._owns_http_client:
+            await self.http_client.aclose()
 
     # =========================================================================
     # Market Data Methods
@@ -80,7 +102,7 @@ class PolymarketRESTClient:
                 params["active"] = "true"
             
             response = await self.http_client.get(url, params=params)
-            data = response.json()
+            data = orjson.loads(response.content)
             return data.get("markets", []) if isinstance(data, dict) else []
         except Exception as e:
             logger.error(f"Failed to fetch markets: {e}")
@@ -172,7 +194,7 @@ class PolymarketRESTClient:
         try:
             url = f"{self.config.api_url}/fee-rate"
             response = await self.http_client.get(url, params={"token_id": token_id})
-            return response.json().get("fee_rate_bps", 0)
+            return orjson.loads(response.content).get("fee_rate_bps", 0)
         except Exception as e:
             logger.error(f"Failed to fetch fee rate for {token_id}: {e}")
             return 0
@@ -9,6 +9,7 @@ import json
 import logging
 from typing import Any, Callable, Dict, List, Optional, Set
 
+import orjson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
@@ -126,7 +127,7 @@ class PolymarketWebSocketClient:
                         continue
 
                 async for message in self._websocket:
-                    await self._process_message(json.loads(message))
+                    await self._process_message(orjson.loads(message))
 
             except ConnectionClosed:
                 logger.warning("WebSocket connection closed")
@@ -12,7 +12,7 @@ Key Concepts:
 """
 
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 
 # Target rebate from Polymarket Maker Rebates Program (20% of ~1.56% = 31 bps)
@@ -180,6 +180,34 @@ def should_quote_side(
     return True
 
 
+def should_quote_sides(
+    skews: Sequence[float],
+    config: Optional[PricingConfig] = None,
+) -> Tuple[List[bool], List[bool]]:
+    """
+    Batch version of should_quote_side for many markets at once.
+    
+    Applies the same one-sided quoting thresholds without per-call side
+    string handling.
+    
+    Args:
+        skews: Inventory skew (-1.0 to 1.0) for each market
+        config: PricingConfig with strategy parameters
+    
+    Returns:
+        Tuple of (can_buy, can_sell) flags, one entry per market
+    """
+    if config is None:
+        config = PricingConfig()
+    
+    buy_stop = config.buy_stop_threshold
+    sell_stop = config.sell_stop_threshold
+    
+    can_buy = [skew <= buy_stop for skew in skews]
+    can_sell = [skew >= sell_stop for skew in skews]
+    return can_buy, can_sell
+
+
 def calculate_quote_prices(
     mid: float,
     spread_bps: int,
@@ -6,7 +6,7 @@ Implements Avellaneda-Stoikov style quoting with inventory adjustment.
 
 import logging
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from polymr.config import QuotingConfig, InventoryConfig
 
@@ -35,6 +35,15 @@ class MarketState:
     spread: float
     volatility: float = 0.02
     volume_24h: float = 0.0
+    yes_token_id: str = ""
+    no_token_id: str = ""
+
+    def __post_init__(self):
+        # Resolve outcome tokens once instead of on every quote
+        if not self.yes_token_id:
+            self.yes_token_id = self.token_ids.get("YES", "")
+        if not self.no_token_id:
+            self.no_token_id = self.token_ids.get("NO", "")
 
 
 class QuoteEngine:
@@ -90,8 +99,8 @@ class QuoteEngine:
         no_size = self._calculate_size(inventory, total_exposure_usd, "NO")
 
         # Create quotes
-        yes_token = market_state.token_ids.get("YES")
-        no_token = market_state.token_ids.get("NO")
+        yes_token = market_state.yes_token_id
+        no_token = market_state.no_token_id
 
         yes_quote = Quote(
             token_id=yes_token,
@@ -213,8 +222,8 @@ class QuoteEngine:
             inventory, total_exposure_usd, "NO"
         )
 
-        yes_token = market_state.token_ids.get("YES")
-        no_token = market_state.token_ids.get("NO")
+        yes_token = market_state.yes_token_id
+        no_token = market_state.no_token_id
 
         return (
             Quote(
@@ -282,13 +291,45 @@ class SpreadCalculator:
         market_depth: float,
     ) -> float:
         """Estimate probability of order fill based on spread and size."""
-        spread = spread_bps / 10000
+        return _fill_probability(spread_bps, order_size, market_depth)
+
+    def estimate_fill_probabilities(
+        self,
+        spreads_bps: Sequence[int],
+        order_sizes: Sequence[float],
+        market_depths: Sequence[float],
+    ) -> List[float]:
+        """
+        Estimate fill probabilities for a batch of candidate orders.
+
+        Evaluates every (spread, size, depth) triple in a single pass so
+        callers ranking many quote candidates avoid one method call each.
+
+        Args:
+            spreads_bps: Spread of each candidate in basis points.
+            order_sizes: Size of each candidate order.
+            market_depths: Market depth seen by each candidate.
+
+        Returns:
+            Fill probability for each candidate, in input order.
+        """
+        return [
+            _fill_probability(spread_bps, order_size, market_depth)
+            for spread_bps, order_size, market_depth in zip(
+                spreads_bps, order_sizes, market_depths
+            )
+        ]
+
+
+def _fill_probability(spread_bps: float, order_size: float, market_depth: float) -> float:
+    """Fill probability model shared by the scalar and batch estimators."""
+    spread = spread_bps / 10000
 
-        # Higher spread = higher fill probability
-        base_prob = min(0.95, 0.3 + spread * 10)
+    # Higher spread = higher fill probability
+    base_prob = min(0.95, 0.3 + spread * 10)
 
-        # Larger orders = lower fill probability
-        size_factor = min(1.0, market_depth / order_size)
-        size_adjustment = size_factor * 0.3
+    # Larger orders = lower fill probability
+    size_factor = min(1.0, market_depth / order_size)
+    size_adjustment = size_factor * 0.3
 
-        return min(0.95, base_prob + size_adjustment)
+    return min(0.95, base_prob + size_adjustment)
@@ -5,6 +5,7 @@ Implements position limits, exposure checks, and circuit breakers.
 """
 
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
@@ -23,7 +24,7 @@ class RiskLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(frozen=True)
 class RiskCheckResult:
     """Result of a risk check."""
     allowed: bool
@@ -32,6 +33,14 @@ class RiskCheckResult:
     details: Optional[Dict[str, Any]] = None
 
 
+# Shared result for the common case where every pre-trade check passes.
+_OK_ALL = RiskCheckResult(
+    allowed=True,
+    level=RiskLevel.LOW,
+    reason="All checks passed",
+)
+
+
 @dataclass
 class RiskState:
     """Current risk state of the bot."""
@@ -41,10 +50,10 @@ class RiskState:
     current_equity: float = 0.0
     consecutive_losses: int = 0
     api_failure_count: int = 0
-    last_api_failure: Optional[datetime] = None
+    last_api_failure_ts: float = 0.0  # time.monotonic() of last failure
     trading_paused: bool = False
     pause_reason: str = ""
-    pause_until: Optional[datetime] = None
+    pause_until_ts: float = 0.0  # time.monotonic() when trading resumes
 
 
 class RiskManager:
@@ -61,6 +70,21 @@ class RiskManager:
         self.state = RiskState(current_equity=initial_equity, peak_equity=initial_equity)
         self._circuit_breakers_triggered = False
 
+        # Order size is bounded by whichever of the two size limits is tighter
+        if inventory_config.max_single_order_usd <= inventory_config.max_position_size_usd:
+            self._effective_size_limit = inventory_config.max_single_order_usd
+            self._size_limit_name = "max single order"
+        else:
+            self._effective_size_limit = inventory_config.max_position_size_usd
+            self._size_limit_name = "max position size"
+
+        # Config-derived ratios used on every check
+        self._stop_loss_frac = risk_config.stop_loss_pct / 100.0
+        self._stop_loss_cooldown_s = risk_config.stop_loss_cooldown_minutes * 60.0
+        self._max_inventory_skew = inventory_config.max_inventory_skew
+        self._min_exposure = inventory_config.min_exposure_usd
+        self._max_exposure = inventory_config.max_exposure_usd
+
     def check_pre_trade(
         self,
         token_id: str,
@@ -71,6 +95,10 @@ class RiskManager:
         inventory: Dict[str, float],
     ) -> RiskCheckResult:
         """Perform pre-trade risk checks."""
+        # Fast path: every check passes, skip building per-check results
+        if self._fast_ok(side, size, current_exposure, inventory):
+            return _OK_ALL
+
         # Check if trading is paused
         if self.state.trading_paused:
             return RiskCheckResult(
@@ -96,11 +124,32 @@ class RiskManager:
         if not skew_result.allowed:
             return skew_result
 
-        return RiskCheckResult(
-            allowed=True,
-            level=RiskLevel.LOW,
-            reason="All checks passed",
-        )
+        return _OK_ALL
+
+    def _fast_ok(
+        self,
+        side: str,
+        size: float,
+        current_exposure: float,
+        inventory: Dict[str, float],
+    ) -> bool:
+        """Check whether all pre-trade limits pass without building diagnostics."""
+        if self.state.trading_paused:
+            return False
+
+        if size > self._effective_size_limit:
+            return False
+
+        new_exposure = current_exposure + size if side == "BUY" else current_exposure - size
+        if not self._min_exposure <= new_exposure <= self._max_exposure:
+            return False
+
+        if inventory:
+            total = sum(abs(v) for v in inventory.values())
+            if total > 0 and abs(sum(inventory.values()) / total) > self._max_inventory_skew:
+                return False
+
+        return True
 
     def _check_exposure(
         self,
@@ -136,18 +185,11 @@ class RiskManager:
 
     def _check_position_size(self, size: float) -> RiskCheckResult:
         """Check single position size limit."""
-        if size > self.inventory.max_single_order_usd:
+        if size > self._effective_size_limit:
             return RiskCheckResult(
                 allowed=False,
                 level=RiskLevel.MEDIUM,
-                reason=f"Order size {size:.2f} exceeds max single order {self.inventory.max_single_order_usd}",
-            )
-
-        if size > self.inventory.max_position_size_usd:
-            return RiskCheckResult(
-                allowed=False,
-                level=RiskLevel.MEDIUM,
-                reason=f"Order size {size:.2f} exceeds max position size {self.inventory.max_position_size_usd}",
+                reason=f"Order size {size:.2f} exceeds {self._size_limit_name} {self._effective_size_limit}",
             )
 
         return RiskCheckResult(
@@ -177,7 +219,7 @@ class RiskManager:
         net = sum(inventory.values())
         skew = net / total if total > 0 else 0
 
-        max_skew = self.inventory.max_inventory_skew
+        max_skew = self._max_inventory_skew
         if abs(skew) > max_skew:
             return RiskCheckResult(
                 allowed=False,
@@ -196,15 +238,15 @@ class RiskManager:
         """Check if daily loss limit has been breached."""
         loss_pct = -daily_pnl / self.state.peak_equity if self.state.peak_equity > 0 else 0
 
-        if loss_pct >= self.risk.stop_loss_pct / 100:
+        if loss_pct >= self._stop_loss_frac:
             self._trigger_circuit_breaker(
                 "Daily loss limit reached",
-                datetime.utcnow() + timedelta(minutes=self.risk.stop_loss_cooldown_minutes),
+                self._stop_loss_cooldown_s,
             )
             return RiskCheckResult(
                 allowed=False,
                 level=RiskLevel.CRITICAL,
-                reason=f"Daily loss {loss_pct:.2%} exceeds limit {self.risk.stop_loss_pct/100:.2%}",
+                reason=f"Daily loss {loss_pct:.2%} exceeds limit {self._stop_loss_frac:.2%}",
             )
 
         return RiskCheckResult(
@@ -224,7 +266,7 @@ class RiskManager:
         if self.state.consecutive_losses >= max_consecutive:
             self._trigger_circuit_breaker(
                 f"{self.state.consecutive_losses} consecutive losses",
-                datetime.utcnow() + timedelta(minutes=30),
+                30 * 60.0,
             )
             return RiskCheckResult(
                 allowed=False,
@@ -241,13 +283,13 @@ class RiskManager:
     def record_api_failure(self) -> None:
         """Record an API failure."""
         self.state.api_failure_count += 1
-        self.state.last_api_failure = datetime.utcnow()
+        self.state.last_api_failure_ts = self._now()
 
         max_failures = 5
         if self.state.api_failure_count >= max_failures:
             self._trigger_circuit_breaker(
                 f"{self.state.api_failure_count} API failures",
-                datetime.utcnow() + timedelta(minutes=5),
+                5 * 60.0,
             )
 
     def record_api_success(self) -> None:
@@ -262,15 +304,19 @@ class RiskManager:
         if new_equity > self.state.peak_equity:
             self.state.peak_equity = new_equity
 
+    def _now(self) -> float:
+        """Monotonic clock used for all cooldown bookkeeping."""
+        return time.monotonic()
+
     def _trigger_circuit_breaker(
         self,
         reason: str,
-        pause_until: datetime,
+        cooldown_seconds: float,
     ) -> None:
         """Trigger a circuit breaker."""
         self.state.trading_paused = True
         self.state.pause_reason = reason
-        self.state.pause_until = pause_until
+        self.state.pause_until_ts = self._now() + cooldown_seconds
         self._circuit_breakers_triggered = True
         logger.warning(f"Circuit breaker triggered: {reason}")
 
@@ -278,15 +324,15 @@ class RiskManager:
         """Check and update circuit breaker status."""
         results = []
 
-        if self.state.trading_paused and self.state.pause_until:
-            if datetime.utcnow() >= self.state.pause_until:
+        if self.state.trading_paused and self.state.pause_until_ts:
+            remaining = self.state.pause_until_ts - self._now()
+            if remaining <= 0:
                 self.state.trading_paused = False
                 self.state.pause_reason = ""
-                self.state.pause_until = None
+                self.state.pause_until_ts = 0.0
                 self._circuit_breakers_triggered = False
                 logger.info("Circuit breaker reset - trading resumed")
             else:
-                remaining = (self.state.pause_until - datetime.utcnow()).total_seconds()
                 results.append(
                     RiskCheckResult(
                         allowed=False,
@@ -299,6 +345,11 @@ class RiskManager:
 
     def get_risk_summary(self) -> Dict[str, Any]:
         """Get current risk summary."""
+        pause_until = None
+        if self.state.trading_paused and self.state.pause_until_ts:
+            remaining = max(0.0, self.state.pause_until_ts - self._now())
+            pause_until = (datetime.utcnow() + timedelta(seconds=remaining)).isoformat()
+
         return {
             "current_equity": self.state.current_equity,
             "daily_pnl": self.state.daily_pnl,
@@ -306,6 +357,7 @@ class RiskManager:
             "consecutive_losses": self.state.consecutive_losses,
             "trading_paused": self.state.trading_paused,
             "pause_reason": self.state.pause_reason,
+            "pause_until": pause_until,
             "api_failures": self.state.api_failure_count,
             "circuit_breakers_triggered": self._circuit_breakers_triggered,
         }
@@ -1,6 +1,9 @@
 
-from polymr.services.auto_redeem import AutoRedeemService
+from polymr.services.auto_redeem import AutoRedeemService, PositionPoller, RedeemRecord, to_json
 
 __all__ = [
     "AutoRedeemService",
+    "PositionPoller",
+    "RedeemRecord",
+    "to_json",
 ]
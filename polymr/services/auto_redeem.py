@@ -6,8 +6,12 @@ Handles automatic redemption of settled markets.
 
 import asyncio
 import logging
+import random
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from operator import mul
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import orjson
 
 from polymr.config import AutoRedeemConfig
 from polymr.polymarket.rest_client import PolymarketRESTClient
@@ -15,16 +19,150 @@ from polymr.polymarket.rest_client import PolymarketRESTClient
 logger = logging.getLogger(__name__)
 
 
+class RedeemRecord(NamedTuple):
+    """A position that was redeemed during a check."""
+
+    token_id: str
+    size: float
+    timestamp: str
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, RedeemRecord):
+        return obj._asdict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def to_json(results: Dict[str, Any]) -> bytes:
+    """Serialize check_and_redeem results to JSON bytes."""
+    return orjson.dumps(results, default=_json_default, option=orjson.OPT_UTC_Z)
+
+
+def positions_to_soa(positions: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Convert a list of position dicts into per-field columns."""
+    _get = dict.get
+    return {
+        "token_id": [_get(p, "token_id") for p in positions],
+        "size": [_get(p, "size", 0) for p in positions],
+        "avg_price": [_get(p, "avg_price", 0) for p in positions],
+    }
+
+
+def _exposure(sizes: List[float], prices: List[float]) -> float:
+    """Sum of |size * price| in a single pass with no intermediate lists."""
+    return sum(map(abs, map(mul, sizes, prices)))
+
+
+class PositionPoller:
+    """
+    Coalesces concurrent position requests into a single REST call.
+
+    Callers await get_positions(); a background worker collects every
+    request that arrives within the batch window, fetches positions once
+    and hands the same result to all of them.
+    """
+
+    def __init__(
+        self,
+        client: PolymarketRESTClient,
+        batch_window_ms: int = 50,
+    ):
+        self.client = client
+        self._batch_window = batch_window_ms / 1000
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    async def get_positions(self) -> List[Dict[str, Any]]:
+        """Request positions, sharing the fetch with concurrent callers."""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(future)
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+        return await future
+
+    async def close(self) -> None:
+        """Stop the background worker and cancel requests it has not answered."""
+        if self._worker and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+
+        while not self._queue.empty():
+            waiter = self._queue.get_nowait()
+            if not waiter.done():
+                waiter.cancel()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            waiters = [await self._queue.get()]
+
+            try:
+                # Gather every request that arrives within the batch window
+                deadline = loop.time() + self._batch_window
+                while (remaining := deadline - loop.time()) > 0:
+                    try:
+                        waiters.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+                try:
+                    positions = await self.client.get_positions()
+                except Exception as e:
+                    for waiter in waiters:
+                        if not waiter.done():
+                            waiter.set_exception(e)
+                    continue
+
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(positions)
+            finally:
+                # Only left unresolved if the worker was cancelled mid-batch
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.cancel()
+
+
 class AutoRedeemService:
-    """Handles automatic position redemption for settled markets."""
+    """
+    Handles automatic position redemption for settled markets.
+
+    The periodic check is dominated by event-loop scheduling; running under
+    uvloop (installed by polymr.main when available) is recommended.
+    """
 
     def __init__(
         self,
         client: PolymarketRESTClient,
         config: AutoRedeemConfig,
+        poller: Optional[PositionPoller] = None,
     ):
         self.client = client
         self.config = config
+        self.poller = poller or PositionPoller(client, config.batch_window_ms)
+
+        # Read once; positions are valued at 0.01 USD per token against it
+        self._threshold_usd = config.threshold_usd
+
+        # Column view of the last fetched positions, reused by analytics
+        self._positions_soa: Optional[Dict[str, List[Any]]] = None
+
+        # (positions soa, rates, result) of the last rebate potential calculation
+        # on the stored positions; a new fetch replaces the soa object
+        self._rebate_cache: Optional[
+            Tuple[Dict[str, List[Any]], Tuple[float, float], Dict[str, Any]]
+        ] = None
+
+    async def close(self) -> None:
+        """Stop the position poller's background worker."""
+        await self.poller.close()
 
     async def check_and_redeem(self) -> Dict[str, Any]:
         """Check positions and redeem settled ones."""
@@ -35,80 +173,130 @@ class AutoRedeemService:
         }
 
         try:
-            positions = await self.client.get_positions()
+            positions = await self.poller.get_positions()
+            self._positions_soa = positions_to_soa(positions)
 
-            for position in positions:
-                token_id = position.get("token_id")
-                size = position.get("size", 0)
+            # One timestamp for the whole batch
+            timestamp = datetime.utcnow().isoformat()
 
-                if size <= 0:
-                    continue
+            # Classify every position in one pass:
+            # 0 = not held, 1 = below threshold, 2 = eligible
+            soa = self._positions_soa
+            token_ids, sizes = soa["token_id"], soa["size"]
+            threshold = self._threshold_usd
+            labels = [(size > 0) * (1 + (size * 0.01 >= threshold)) for size in sizes]
+            by_label: Tuple[List[int], List[int], List[int]] = ([], [], [])
+            for index, label in enumerate(labels):
+                by_label[label].append(index)
 
-                # Check if position can be redeemed (simplified)
-                # In production, you'd check if the market is resolved
-                try:
-                    # Get market info for this position
-                    if size * 0.01 < self.config.threshold_usd:
-                        results["skipped"].append({
-                            "token_id": token_id,
-                            "size": size,
-                            "reason": "Below redemption threshold",
-                        })
-                        continue
-
-                    # In production, this would call the actual redeem function
-                    logger.info(f"Position {token_id}: {size} tokens eligible for redemption")
-
-                    results["redeemed"].append({
-                        "token_id": token_id,
-                        "size": size,
-                        "timestamp": datetime.utcnow().isoformat(),
-                    })
+            results["skipped"] = [
+                {
+                    "token_id": token_ids[i],
+                    "size": sizes[i],
+                    "reason": "Below redemption threshold",
+                }
+                for i in by_label[1]
+            ]
+            eligible = [(token_ids[i], sizes[i]) for i in by_label[2]]
 
-                except Exception as e:
-                    results["errors"].append({
-                        "token_id": token_id,
-                        "error": str(e),
-                    })
+            # Fan out independent redemptions, bounded by max_concurrency
+            semaphore = asyncio.Semaphore(self.config.max_concurrency)
+            outcomes = await asyncio.gather(
+                *(
+                    self._process_position(token_id, size, semaphore, timestamp)
+                    for token_id, size in eligible
+                ),
+                return_exceptions=True,
+            )
+
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    results["errors"].append({"error": str(outcome)})
+                    continue
+                category, record = outcome
+                results[category].append(record)
 
         except Exception as e:
-            logger.error(f"Error checking positions: {e}")
+            logger.error("Error checking positions: %s", e)
             results["errors"].append({"error": str(e)})
 
         return results
 
+    async def _process_position(
+        self,
+        token_id: str,
+        size: float,
+        semaphore: asyncio.Semaphore,
+        timestamp: str,
+    ) -> Tuple[str, Any]:
+        """Redeem a single eligible position, returning its result category and record."""
+        async with semaphore:
+            # Check if position can be redeemed (simplified)
+            # In production, you'd check if the market is resolved
+            try:
+                # In production, this would call the actual redeem function
+                logger.info("Position %s: %s tokens eligible for redemption", token_id, size)
+
+                return "redeemed", RedeemRecord(token_id, size, timestamp)
+
+            except Exception as e:
+                return "errors", {
+                    "token_id": token_id,
+                    "error": str(e),
+                }
+
     async def run_periodic_check(self, interval: Optional[int] = None) -> None:
         """Run periodic redemption checks."""
         check_interval = interval or self.config.check_interval_seconds
+        max_backoff = max(check_interval, self.config.max_backoff_seconds)
+        delay = check_interval
 
         while True:
+            failed = False
             try:
                 results = await self.check_and_redeem()
+                failed = bool(results["errors"])
                 if results["redeemed"]:
-                    logger.info(
-                        f"Redeemed {len(results['redeemed'])} positions"
-                    )
+                    logger.info("Redeemed %d positions", len(results["redeemed"]))
             except Exception as e:
-                logger.error(f"Error in periodic redemption check: {e}")
+                failed = True
+                logger.error("Error in periodic redemption check: %s", e)
 
-            await asyncio.sleep(check_interval)
+            # Back off exponentially on errors, reset once a check succeeds
+            delay = min(delay * 2, max_backoff) if failed else check_interval
+
+            # Jitter so multiple instances don't poll in lockstep
+            await asyncio.sleep(delay * random.uniform(0.9, 1.1))
 
     def calculate_rebate_potential(
         self,
-        positions: List[Dict[str, Any]],
+        positions: Optional[List[Dict[str, Any]]],
         avg_fill_rate: float,
         rebate_rate: float,
     ) -> Dict[str, Any]:
-        """Calculate potential rebates from positions."""
-        total_exposure = sum(
-            abs(p.get("size", 0) * p.get("avg_price", 0))
-            for p in positions
-        )
+        """
+        Calculate potential rebates from positions.
+
+        Pass None to reuse the positions from the last check_and_redeem.
+        """
+        rates = (avg_fill_rate, rebate_rate)
+        if positions is not None:
+            soa = positions_to_soa(positions)
+        else:
+            soa = self._positions_soa
+            # Reuse the previous result until positions are refetched or rates change
+            cache = self._rebate_cache
+            if soa is not None and cache is not None and cache[0] is soa and cache[1] == rates:
+                return dict(cache[2])
+            if soa is None:
+                soa = positions_to_soa([])
+
+        total_exposure = _exposure(soa["size"], soa["avg_price"])
 
         expected_fills = total_exposure * avg_fill_rate
         expected_rebate = expected_fills * rebate_rate
 
-        return {
+        result = {
             "total_exposure": total_exposure,
             "expected_fills": expected_fills,
             "expected_rebate_daily": expected_rebate,
@@ -116,3 +304,6 @@ class AutoRedeemService:
             "rebate_rate": rebate_rate,
             "avg_fill_rate": avg_fill_rate,
         }
+        if positions is None and soa is self._positions_soa:
+            self._rebate_cache = (soa, rates, result)
+        return dict(result)
@@ -12,71 +12,99 @@ MARKETS = [
     {"q": "Will SOL exceed $200 in 24h?", "fee": 200, "vol": 8000, "t": ["0xY3", "0xN3"]},
 ]
 
+CYCLES = 5
+EQ = "=" * 60
+DASH = "-" * 60
+
+def draw_ints(rng, n, lo, hi):
+    """Draw n ints in [lo, hi], unpacking four 16-bit lanes per 64-bit word."""
+    span = hi - lo + 1
+    out = []
+    while len(out) < n:
+        r = rng.getrandbits(64)
+        out.extend(((r >> shift) & 0xFFFF) % span + lo for shift in (0, 16, 32, 48))
+    return out[:n]
+
 def run():
     capital = float(sys.argv[1]) if len(sys.argv) > 1 else 60
     order_size = capital * 0.3
     min_spread, max_spread = 3, 15
     
-    print("\n" + "=" * 60)
-    print("  POLYMR - Market Making Bot (Quick Test)")
-    print("=" * 60)
-    print(f"\n📊 Capital: ${capital:.2f} | Order: ${order_size:.2f} | Spread: {min_spread}-{max_spread} bps")
-    print("\n🔍 Found 3 eligible markets:")
+    # Draw all randomness for the run up front, one row per cycle
+    rng = random.Random()
+    shape = [range(len(MARKETS)) for _ in range(CYCLES)]
+    mids = [[round(rng.uniform(0.35, 0.65), 4) for _ in row] for row in shape]
+    spreads = [[bps / 10000 for bps in draw_ints(rng, len(row), min_spread, max_spread)] for row in shape]
+    fills = [[rng.random() < 0.4 for _ in row] for row in shape]
+    
+    # Collect output lines and write them in one go at the end
+    buf = []
+    out = buf.append
+    
+    out("\n" + EQ)
+    out("  POLYMR - Market Making Bot (Quick Test)")
+    out(EQ)
+    out(f"\n📊 Capital: ${capital:.2f} | Order: ${order_size:.2f} | Spread: {min_spread}-{max_spread} bps")
+    out("\n🔍 Found 3 eligible markets:")
     for m in MARKETS:
-        print(f"   • {m['q'][:45]}... | Fee: {m['fee']}bps | Vol: ${m['vol']:,}")
+        out(f"   • {m['q'][:45]}... | Fee: {m['fee']}bps | Vol: ${m['vol']:,}")
     
-    print("\n" + "-" * 60)
-    print("\n🚀 Quote Cycle (5 iterations):")
-    print("-" * 60)
+    out("\n" + DASH)
+    out(f"\n🚀 Quote Cycle ({CYCLES} iterations):")
+    out(DASH)
     
     exposure = 0
     inventory = {"YES": 0, "NO": 0}
     total_rebate = 0
+    fee_rates = [m["fee"] / 10000 for m in MARKETS]
     
-    for cycle in range(1, 6):
-        print(f"\n🔄 Cycle {cycle} | Exp: ${exposure:.2f}")
+    for cycle in range(1, CYCLES + 1):
+        out(f"\n🔄 Cycle {cycle} | Exp: ${exposure:.2f}")
+        
+        # Quote and fill accounting for the whole cycle at once
+        row = cycle - 1
+        bids = [round(mid - spread/2, 4) for mid, spread in zip(mids[row], spreads[row])]
+        asks = [round(mid + spread/2, 4) for mid, spread in zip(mids[row], spreads[row])]
+        buy_rebates = [order_size * bid * rate for bid, rate in zip(bids, fee_rates)]
+        sell_rebates = [order_size * ask * rate for ask, rate in zip(asks, fee_rates)]
+        filled = [i for i, hit in enumerate(fills[row]) if hit]
         
-        for m in MARKETS:
-            mid = round(random.uniform(0.35, 0.65), 4)
-            spread = random.randint(min_spread, max_spread) / 10000
-            bid = round(mid - spread/2, 4)
-            ask = round(mid + spread/2, 4)
-            
-            # Simulate fill (40% chance)
-            if random.random() < 0.4:
-                # BUY filled
-                inventory["YES"] += order_size * bid
-                exposure += order_size
-                rebate = order_size * bid * m["fee"] / 10000
-                total_rebate += rebate
-                print(f"   📈 {m['t'][0][-6:]}... BUY  ${order_size:.0f} @ {bid} ✅ +${rebate:.4f}")
-                
-                # SELL filled
-                inventory["NO"] += order_size * ask
-                exposure -= order_size
-                rebate = order_size * ask * m["fee"] / 10000
-                total_rebate += rebate
-                print(f"   📉 {m['t'][1][-6:]}... SELL ${order_size:.0f} @ {ask} ✅ +${rebate:.4f}")
+        # Each fill is a BUY on YES and a SELL on NO; the two legs offset,
+        # so fills leave exposure unchanged
+        inventory["YES"] += sum(order_size * bids[i] for i in filled)
+        inventory["NO"] += sum(order_size * asks[i] for i in filled)
+        total_rebate += sum(buy_rebates[i] + sell_rebates[i] for i in filled)
+        
+        for i, m in enumerate(MARKETS):
+            if fills[row][i]:
+                out(f"   📈 {m['t'][0][-6:]}... BUY  ${order_size:.0f} @ {bids[i]} ✅ +${buy_rebates[i]:.4f}")
+                out(f"   📉 {m['t'][1][-6:]}... SELL ${order_size:.0f} @ {asks[i]} ✅ +${sell_rebates[i]:.4f}")
             else:
-                print(f"   💤 {m['t'][0][-6:]}... {m['t'][1][-6:]} - No fills this cycle")
+                out(f"   💤 {m['t'][0][-6:]}... {m['t'][1][-6:]} - No fills this cycle")
         
         # Rebalance check
         if abs(inventory["YES"] - inventory["NO"]) > order_size * 2:
-            print("   ⚠️  High skew detected - widening spread")
+            out("   ⚠️  High skew detected - widening spread")
         
         if exposure > capital:
-            print("   🛑 Exposure limit reached!")
+            out("   🛑 Exposure limit reached!")
             break
     
-    print("\n" + "=" * 60)
-    print("  SUMMARY")
-    print("=" * 60)
-    print(f"\n  Final Exposure:  ${exposure:.2f}")
-    print(f"  Final Inventory: YES: {inventory['YES']:.2f} | NO: {inventory['NO']:.2f}")
-    print(f"  Total Rebates:   ${total_rebate:.4f}")
-    print(f"  Daily Yield:     {(total_rebate/capital)*100:.2f}%")
-    print(f"\n  💰 At this rate: ${total_rebate*24:.2f}/day on ${capital} capital")
-    print("=" * 60)
+    out(f"""
+{EQ}
+  SUMMARY
+{EQ}
+
+  Final Exposure:  ${exposure:.2f}
+  Final Inventory: YES: {inventory['YES']:.2f} | NO: {inventory['NO']:.2f}
+  Total Rebates:   ${total_rebate:.4f}
+  Daily Yield:     {(total_rebate/capital)*100:.2f}%
+
+  💰 At this rate: ${total_rebate*24:.2f}/day on ${capital} capital
+{EQ}""")
+    
+    sys.stdout.write("\n".join(buf) + "\n")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     run()
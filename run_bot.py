@@ -4,30 +4,51 @@ Polymr - Market Making Bot
 
 Real trading via py_clob_client or realistic sandbox simulation.
 
-Usage: python run_bot.py [capital] [aggro] [--sandbox|--real]
+Usage: python run_bot.py [capital] [aggro|--aggro=N] [--sandbox|--real] [--hot] [--pin=CORE]
 
 Real mode requires: POLYMARKET_PRIVATE_KEY and POLYMARKET_FUNDER env vars.
+
+--hot busy-polls the market feed socket on a pinned core for lower wakeup
+latency. It keeps that core at 100%, so only use it on a dedicated machine.
+The poller is Python, so it also competes with the trading loop for the GIL:
+feed updates land sooner, but each cycle can run slower. Measure before
+relying on it. With --pin it stays off the trading core.
+
+--pin=CORE runs the trading loop on CORE (Linux) with SCHED_FIFO priority,
+falling back to a lower nice value without root. I/O workers are kept off
+that core. For the least jitter, reserve the core at boot with
+isolcpus=CORE nohz_full=CORE rcu_nocbs=CORE and disable deep C-states
+(intel_idle.max_cstate=0).
 """
 
 import os
+import re
 import sys
 import time
+import queue
 import random
+import bisect
+import heapq
+import itertools
 import threading
+from array import array
 from pathlib import Path
 from datetime import datetime, timedelta
 from collections import defaultdict
-from dataclasses import dataclass
-from typing import Optional, Dict, List, Any
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional, Callable, Dict, Iterable, List, Set, Tuple, Any
 from enum import Enum
 from abc import ABC, abstractmethod
 
+import orjson
+from cachetools import TTLCache
+
 sys.path.insert(0, str(Path(__file__).parent))
 
 from polymr.pricing import (
     calculate_optimal_spread,
     calculate_positioning_factor,
-    should_quote_side,
     calculate_quote_prices,
     get_aggression_config,
     PricingConfig,
@@ -69,11 +90,35 @@ AGGRO = {
 }
 
 DEFAULT_GAS_PRICE_GWEI = 30
+# USD charged per gwei of gas price for placing / cancelling one order
+GAS_PLACE_USD_PER_GWEI = 0.05 * 0.80
+GAS_CANCEL_USD_PER_GWEI = 0.03 * 0.80
 MIN_VOLUME_USD = 5000
 MIN_FEE_BPS = 50
 MAX_PER_MARKET_PCT = 0.30
 MAX_NET_EXPOSURE_PCT = 0.50
 MAKER_REBATE_RATE = 0.20
+FEE_CACHE_TTL_S = 300
+FEE_CACHE_SIZE = 4096
+GAS_CACHE_TTL_S = 10
+BOOK_CACHE_TTL_S = 0.5
+BOOK_CACHE_SIZE = 1024
+TRADES_CACHE_TTL_S = 1.0
+MAX_IO_WORKERS = 16
+MAX_BATCH_ORDERS = 15  # CLOB limit on orders per batch post
+CYCLE_PERIOD_S = 3.0
+MIN_CYCLE_PERIOD_S = 1.0  # Floor between feed-triggered cycles
+BOOK_TIMEOUT_S = (1.0, 0.4, 0.4, 0.2)  # connect, read, write, pool
+MAX_QUOTE_LATENCY_MS = 500  # Stop quoting a cycle this long after its books arrived
+WS_PING_INTERVAL_S = 10
+WS_PING_TIMEOUT_S = 5
+WS_RECONNECT_MIN_S = 1.0
+WS_RECONNECT_MAX_S = 30.0
+PRICE_TICKS = 10_000  # Quotes are rounded to 4 decimals, so 1 tick = 0.0001
+
+CRYPTO_KEYWORDS = frozenset({"btc", "bitcoin", "eth", "ethereum", "sol", "solana", "crypto"})
+CRYPTO_KEYWORDS_RE = re.compile("|".join(sorted(CRYPTO_KEYWORDS)))
+INTRADAY_TAGS = frozenset({"15-min", "15m", "15 minute"})
 
 
 class OrderSide(Enum):
@@ -88,7 +133,12 @@ class OrderStatus(Enum):
     EXPIRED = "expired"
 
 
-@dataclass
+def to_ticks(price: float) -> int:
+    """Fixed-point price, so level comparisons are exact integer compares."""
+    return round(price * PRICE_TICKS)
+
+
+@dataclass(slots=True)
 class Order:
     order_id: str
     market_id: str
@@ -102,9 +152,13 @@ class Order:
     nonce: int
     filled_qty: float = 0.0
     filled_price: float = 0.0
+    price_ticks: int = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.price_ticks = to_ticks(self.price)
 
 
-@dataclass
+@dataclass(slots=True)
 class Market:
     condition_id: str
     question: str
@@ -115,12 +169,59 @@ class Market:
     end_time: str
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderBook:
-    bids: List[Dict]
-    asks: List[Dict]
+    # One price and one size column per side, best level first
+    # (bids descending, asks ascending)
+    bid_prices: array = field(default_factory=lambda: array("d"))
+    bid_sizes: array = field(default_factory=lambda: array("d"))
+    ask_prices: array = field(default_factory=lambda: array("d"))
+    ask_sizes: array = field(default_factory=lambda: array("d"))
     midpoint: float = 0.5
     spread_bps: float = 0.0
+    
+    # Tick-price columns with running size totals for bisect depth lookups,
+    # built on the first depth query so books only read for mid/spread skip
+    # them. Bid ticks are negated so both columns sort ascending.
+    _ask_ticks: Optional[List[int]] = field(default=None, init=False, repr=False)
+    _ask_cum: List[float] = field(default_factory=list, init=False, repr=False)
+    _bid_ticks: List[int] = field(default_factory=list, init=False, repr=False)
+    _bid_cum: List[float] = field(default_factory=list, init=False, repr=False)
+    
+    @classmethod
+    def from_levels(cls, bids: Iterable[Tuple[float, float]], asks: Iterable[Tuple[float, float]],
+                    depth: int = 20) -> "OrderBook":
+        """Build a book from (price, size) levels in any order, keeping the best depth per side."""
+        bids = sorted(bids, reverse=True)[:depth]
+        asks = sorted(asks)[:depth]
+        book = cls(
+            array("d", [p for p, _ in bids]), array("d", [s for _, s in bids]),
+            array("d", [p for p, _ in asks]), array("d", [s for _, s in asks]),
+        )
+        if bids and asks:
+            book.midpoint = (bids[0][0] + asks[0][0]) / 2
+            book.spread_bps = (asks[0][0] - bids[0][0]) / book.midpoint * 10000
+        return book
+    
+    def _index(self):
+        self._ask_ticks = [to_ticks(p) for p in self.ask_prices]
+        self._ask_cum = list(itertools.accumulate(self.ask_sizes))
+        self._bid_ticks = [-to_ticks(p) for p in self.bid_prices]
+        self._bid_cum = list(itertools.accumulate(self.bid_sizes))
+    
+    def ask_depth_upto(self, price_ticks: int) -> float:
+        """Total ask size priced at or below price_ticks."""
+        if self._ask_ticks is None:
+            self._index()
+        i = bisect.bisect_right(self._ask_ticks, price_ticks)
+        return self._ask_cum[i - 1] if i else 0.0
+    
+    def bid_depth_downto(self, price_ticks: int) -> float:
+        """Total bid size priced at or above price_ticks."""
+        if self._ask_ticks is None:
+            self._index()
+        i = bisect.bisect_right(self._bid_ticks, -price_ticks)
+        return self._bid_cum[i - 1] if i else 0.0
 
 
 class TradingClient(ABC):
@@ -142,10 +243,294 @@ class TradingClient(ABC):
     def get_nonce(self) -> int: pass
     @abstractmethod
     def get_recent_trades(self, token_id: str, limit: int = 50) -> List[Dict]: pass
+    
+    def cancel_orders(self, order_ids: List[str]) -> List[str]:
+        """Cancel several orders, returning the ids that were cancelled."""
+        return [oid for oid in order_ids if self.cancel_order(oid)]
+    
+    def submit_orders(self, orders: List[Tuple[Order, int]]) -> List[Dict]:
+        """Submit (order, fee_rate_bps) pairs, returning one response per order in order."""
+        responses = []
+        for order, fee_rate_bps in orders:
+            try:
+                responses.append(self.submit_order(order, fee_rate_bps))
+            except Exception as e:
+                responses.append({"success": False, "errorMsg": str(e)})
+        return responses
+    
+    def cached_orderbook(self, token_id: str) -> Optional[OrderBook]:
+        """Orderbook available without a network round-trip, or None."""
+        return None
+    
+    def get_orderbooks(self, token_ids: List[str], pool: Optional[Executor] = None) -> Dict[str, OrderBook]:
+        """Fetch several orderbooks, overlapping the round-trips of any that need REST on pool."""
+        books: Dict[str, OrderBook] = {}
+        misses: List[str] = []
+        for token_id in token_ids:
+            book = self.cached_orderbook(token_id)
+            if book is None:
+                misses.append(token_id)
+            else:
+                books[token_id] = book
+        if pool is None or len(misses) < 2:
+            for token_id in misses:
+                books[token_id] = self.get_orderbook(token_id)
+        else:
+            books.update(zip(misses, pool.map(self.get_orderbook, misses)))
+        return books
+
+
+def keep_connected(connect: Callable[[], bool], stopped: threading.Event):
+    """Run connect() until stopped, backing off exponentially while connections fail to open.
+
+    connect() should block for the life of one connection and return whether it opened.
+    """
+    delay = WS_RECONNECT_MIN_S
+    while not stopped.is_set():
+        if connect():
+            delay = WS_RECONNECT_MIN_S
+        if stopped.wait(delay):
+            return
+        delay = min(delay * 2, WS_RECONNECT_MAX_S)
+
+
+def heartbeat(get_ws: Callable[[], Any], stopped: threading.Event):
+    """Send the CLOB channels' text "PING" keepalive every WS_PING_INTERVAL_S until stopped.
+
+    One thread per socket for the bot's lifetime; get_ws() returns the live
+    connection, or None while disconnected.
+    """
+    while not stopped.wait(WS_PING_INTERVAL_S):
+        ws = get_ws()
+        if ws is None:
+            continue
+        try:
+            ws.send("PING")
+        except Exception:
+            pass
+
+
+class MarketBookFeed:
+    """Live order books for subscribed tokens from the CLOB market channel."""
+
+    def __init__(self, url: str = "wss://ws-subscriptions-clob.polymarket.com/ws/market", depth: int = 20,
+                 debounce_s: float = 2.0, batch_size: int = 100, hot: bool = False,
+                 pin_core: Optional[int] = None):
+        self.url = url
+        self.depth = depth
+        self.hot = hot
+        # Core reserved for the trading loop; the hot poller must not share it
+        self.pin_core = pin_core
+        self.debounce_s = debounce_s
+        self.batch_size = batch_size
+        self._levels: Dict[str, Dict[str, Dict[float, float]]] = {}
+        self._books: Dict[str, OrderBook] = {}
+        self._lock = threading.Lock()
+        self._tokens: set = set()
+        self._ws = None
+        self._started = False
+        self._connected = False
+        self._opened = False
+        self._stopped = threading.Event()
+        self._sub_lock = threading.Lock()
+        self._pending: List[str] = []
+        self._flush_timer: Optional[threading.Timer] = None
+        # Set whenever a snapshot lands or the top of a book moves
+        self.wake = threading.Event()
+
+    def subscribe(self, token_ids: List[str]):
+        """Start streaming books for token_ids; the first call opens the socket."""
+        with self._sub_lock:
+            new = [t for t in token_ids if t not in self._tokens]
+            if not new:
+                return
+            self._tokens.update(new)
+            if not self._started:
+                # The initial subscribe on connect carries every known token
+                self._started = True
+                self._start()
+                return
+            if not self._connected:
+                return
+            # Group late additions into one debounced subscription update
+            self._pending.extend(new)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.debounce_s, self._flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush(self):
+        import json
+        with self._sub_lock:
+            pending, self._pending = self._pending, []
+            self._flush_timer = None
+            if not self._connected:
+                return
+        for i in range(0, len(pending), self.batch_size):
+            try:
+                self._ws.send(json.dumps({"assets_ids": pending[i:i + self.batch_size], "operation": "subscribe"}))
+            except Exception:
+                pass
+
+    def get(self, token_id: str) -> Optional[OrderBook]:
+        """Current book for token_id, or None until its first snapshot arrives."""
+        with self._lock:
+            book = self._books.get(token_id)
+            if book is None:
+                levels = self._levels.get(token_id)
+                if levels is None:
+                    return None
+                book = self._build(levels)
+                self._books[token_id] = book
+            return book
+
+    def stop(self):
+        self._stopped.set()
+        if self._ws:
+            try:
+                self._ws.close()
+            except Exception:
+                pass
+    
+    def _disconnected(self):
+        """Drop every book so readers fall back to REST until fresh snapshots arrive."""
+        with self._sub_lock:
+            self._connected = False
+        with self._lock:
+            self._levels.clear()
+            self._books.clear()
+
+    def _start(self):
+        try:
+            from websocket import WebSocketApp
+            import json
+        except ImportError:
+            return
+
+        def on_open(ws):
+            with self._sub_lock:
+                tokens = list(self._tokens)
+                self._pending = []
+                self._connected = True
+            self._opened = True
+            ws.send(json.dumps({"assets_ids": tokens, "type": "market"}))
+
+        def on_message(ws, message):
+            try:
+                data = orjson.loads(message)
+            except ValueError:
+                return
+            for event in data if isinstance(data, list) else [data]:
+                self._apply(event)
+
+        def on_close(ws, status, msg):
+            self._disconnected()
+
+        threading.Thread(
+            target=heartbeat, args=(lambda: self._ws if self._connected else None, self._stopped), daemon=True,
+        ).start()
+
+        if self.hot:
+            threading.Thread(target=self._run_hot, args=(on_open, on_message, on_close), daemon=True).start()
+            return
+
+        self._ws = WebSocketApp(self.url, on_open=on_open, on_message=on_message, on_close=on_close)
+
+        def connect() -> bool:
+            self._opened = False
+            try:
+                self._ws.run_forever(ping_interval=WS_PING_INTERVAL_S, ping_timeout=WS_PING_TIMEOUT_S)
+            except Exception:
+                pass
+            self._disconnected()
+            return self._opened
+
+        # on_open resubscribes every known token after each reconnect
+        threading.Thread(target=keep_connected, args=(connect, self._stopped), daemon=True).start()
+
+    def _run_hot(self, on_open, on_message, on_close):
+        """Receive loop that spins on a zero-timeout poll instead of sleeping in select()."""
+        import select
+        from websocket import create_connection
+
+        cpus = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else set()
+        others = cpus - {self.pin_core}
+        if len(cpus) > 1 and others:
+            os.sched_setaffinity(0, {max(others)})
+
+        def connect() -> bool:
+            try:
+                ws = create_connection(self.url)
+            except Exception:
+                return False
+            self._ws = ws
+            on_open(ws)
+
+            sock = ws.sock
+            # TLS may hold decrypted bytes the socket no longer reports as readable
+            buffered = getattr(sock, "pending", lambda: 0)
+            try:
+                while ws.connected:
+                    if not buffered() and not select.select([sock], [], [], 0)[0]:
+                        continue
+                    on_message(ws, ws.recv())
+            except Exception:
+                pass
+            on_close(ws, None, None)
+            return True
+
+        keep_connected(connect, self._stopped)
+
+    def _apply(self, event: Dict):
+        kind = event.get("event_type")
+        if kind == "book":
+            token_id = event.get("asset_id")
+            levels = {
+                "bids": {float(l["price"]): float(l["size"]) for l in event.get("bids") or event.get("buys") or []},
+                "asks": {float(l["price"]): float(l["size"]) for l in event.get("asks") or event.get("sells") or []},
+            }
+            with self._lock:
+                self._levels[token_id] = levels
+                self._books.pop(token_id, None)
+            self.wake.set()
+        elif kind == "price_change":
+            changes = event.get("price_changes") or event.get("changes") or []
+            with self._lock:
+                for c in changes:
+                    token_id = c.get("asset_id") or event.get("asset_id")
+                    levels = self._levels.get(token_id)
+                    if levels is None:
+                        continue
+                    is_bid = c.get("side") == "BUY"
+                    book_side = levels["bids" if is_bid else "asks"]
+                    price, size = float(c["price"]), float(c["size"])
+                    if book_side:
+                        best = max(book_side) if is_bid else min(book_side)
+                        if (price >= best) if is_bid else (price <= best):
+                            self.wake.set()
+                    else:
+                        self.wake.set()
+                    if size > 0:
+                        book_side[price] = size
+                    else:
+                        book_side.pop(price, None)
+                    self._books.pop(token_id, None)
+
+    def _build(self, levels: Dict[str, Dict[float, float]]) -> OrderBook:
+        return OrderBook.from_levels(levels["bids"].items(), levels["asks"].items(), self.depth)
+
+
+def make_http_client():
+    """One pooled keep-alive client per trading client, shared by every REST call."""
+    import httpx
+    return httpx.Client(
+        timeout=httpx.Timeout(10.0, connect=5.0),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+    )
 
 
 class RealTradingClient(TradingClient):
-    def __init__(self, fill_callback=None):
+    def __init__(self, fill_callback=None, hot: bool = False, pin_core: Optional[int] = None):
         self.host = "https://clob.polymarket.com"
         self.chain_id = 137
         self.fill_callback = fill_callback
@@ -163,15 +548,28 @@ class RealTradingClient(TradingClient):
         )
         self.client.set_api_creds(self.client.create_or_derive_api_creds())
         
-        self._nonce = 0
-        self._nonce_lock = threading.Lock()
-        self._fee_cache: Dict[str, int] = {}
-        self._fee_cache_time: Dict[str, float] = {}
+        self._next_nonce = itertools.count().__next__
+        self._fees: TTLCache = TTLCache(maxsize=FEE_CACHE_SIZE, ttl=FEE_CACHE_TTL_S)
+        self._fees_lock = threading.Lock()
+        self._fee_fetch_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+        self._gas_cache: TTLCache = TTLCache(maxsize=1, ttl=GAS_CACHE_TTL_S)
+        self._gas_lock = threading.Lock()
+        self._ob_cache: TTLCache = TTLCache(maxsize=BOOK_CACHE_SIZE, ttl=BOOK_CACHE_TTL_S)
+        self._ob_cache_lock = threading.Lock()
+        self._trades_cache: TTLCache = TTLCache(maxsize=BOOK_CACHE_SIZE, ttl=TRADES_CACHE_TTL_S)
+        self._trades_cache_lock = threading.Lock()
+        
+        self._http = make_http_client()
         
         self._ws = None
         self._ws_thread = None
         self._ws_running = False
+        self._ws_stopped = threading.Event()
+        self._ws_opened = False
+        self._ws_inbox: queue.SimpleQueue = queue.SimpleQueue()
         self._subscribed_tokens: set = set()
+        self._book_feed = MarketBookFeed(hot=hot, pin_core=pin_core)
+        self.wake = self._book_feed.wake
         
         self._api_key = None
         self._api_secret = None
@@ -182,50 +580,36 @@ class RealTradingClient(TradingClient):
         self._start_ws()
     
     def get_nonce(self) -> int:
-        with self._nonce_lock:
-            n = self._nonce
-            self._nonce += 1
-        return n
-    
-    def _get_cached_fee(self, token_id: str) -> Optional[int]:
-        if token_id in self._fee_cache:
-            if time.time() - self._fee_cache_time[token_id] < 300:
-                return self._fee_cache[token_id]
-        return None
-    
-    def _cache_fee(self, token_id: str, fee_bps: int):
-        self._fee_cache[token_id] = fee_bps
-        self._fee_cache_time[token_id] = time.time()
+        return self._next_nonce()
     
     def get_markets(self) -> List[Market]:
-        import httpx
         markets = []
-        client = httpx.Client(timeout=10.0)
         
         try:
-            r = client.get(
+            r = self._http.get(
                 "https://gamma-api.polymarket.com/events",
                 params={"status": "active", "limit": 100}
             )
             if r.status_code != 200:
                 return []
             
-            data = r.json()
+            data = orjson.loads(r.content)
             for event in data.get("events", []):
                 if not event.get("markets"):
                     continue
                 
-                market_data = event["markets"][0]
-                question = event.get("question", "").lower()
-                tags = [t.lower() for t in event.get("tags", [])]
                 volume = event.get("volume") or 0
-                
-                crypto_kw = ["btc", "bitcoin", "eth", "ethereum", "sol", "solana", "crypto"]
-                if not any(kw in question or kw in tags for kw in crypto_kw):
-                    continue
                 if volume < MIN_VOLUME_USD:
                     continue
-                if not any(t in tags for t in ["15-min", "15m", "15 minute"]):
+                
+                market_data = event["markets"][0]
+                title = event.get("question", "")
+                question = title.lower()
+                tags = {t.lower() for t in event.get("tags", [])}
+                
+                if not (CRYPTO_KEYWORDS_RE.search(question) or tags & CRYPTO_KEYWORDS):
+                    continue
+                if not tags & INTRADAY_TAGS:
                     continue
                 
                 token_ids = market_data.get("tokens") or []
@@ -234,7 +618,7 @@ class RealTradingClient(TradingClient):
                 
                 markets.append(Market(
                     condition_id=event.get("condition_id", ""),
-                    question=event.get("question", "")[:100],
+                    question=title[:100],
                     tokens=token_ids,
                     fee_bps=0,
                     volume_24h=volume,
@@ -243,40 +627,57 @@ class RealTradingClient(TradingClient):
                 ))
         except Exception as e:
             print(f"   Market fetch error: {e}")
-        finally:
-            client.close()
         
+        self._book_feed.subscribe([t for m in markets for t in m.tokens])
         return markets
     
+    def cached_orderbook(self, token_id: str) -> Optional[OrderBook]:
+        book = self._book_feed.get(token_id)
+        if book is not None:
+            return book
+        with self._ob_cache_lock:
+            return self._ob_cache.get(token_id)
+    
     def get_orderbook(self, token_id: str) -> OrderBook:
+        book = self.cached_orderbook(token_id)
+        if book is not None:
+            return book
+        self._book_feed.subscribe([token_id])
         try:
             ob = self.client.get_order_book(token_id)
-            bids = [{"price": float(b.price), "size": float(b.size)} for b in ob.bids[:20]]
-            asks = [{"price": float(a.price), "size": float(a.size)} for a in ob.asks[:20]]
-            
-            if bids and asks:
-                mid = (bids[0]["price"] + asks[0]["price"]) / 2
-                spread = (asks[0]["price"] - bids[0]["price"]) / mid * 10000
-            else:
-                mid, spread = 0.5, 0
-            
-            return OrderBook(bids=bids, asks=asks, midpoint=mid, spread_bps=spread)
+            book = OrderBook.from_levels(
+                [(float(b.price), float(b.size)) for b in ob.bids],
+                [(float(a.price), float(a.size)) for a in ob.asks],
+            )
+            with self._ob_cache_lock:
+                self._ob_cache[token_id] = book
+            return book
         except Exception:
-            return OrderBook(bids=[], asks=[])
+            return OrderBook()
     
     def get_fee_rate(self, token_id: str) -> int:
-        cached = self._get_cached_fee(token_id)
-        if cached is not None:
-            return cached
-        try:
-            fee = self.client.get_fee_rate_bps(token_id)
-            self._cache_fee(token_id, fee)
+        with self._fees_lock:
+            fee = self._fees.get(token_id)
+            if fee is not None:
+                return fee
+            fetch_lock = self._fee_fetch_locks[token_id]
+        
+        # Only one thread fetches a cold key; the others wait and reuse it
+        with fetch_lock:
+            with self._fees_lock:
+                fee = self._fees.get(token_id)
+            if fee is not None:
+                return fee
+            try:
+                fee = self.client.get_fee_rate_bps(token_id)
+            except Exception:
+                return 0
+            with self._fees_lock:
+                self._fees[token_id] = fee
             return fee
-        except Exception:
-            return 0
     
-    def submit_order(self, order: Order, fee_rate_bps: int) -> Dict:
-        from py_clob_client.clob_types import OrderArgs, OrderType
+    def _sign(self, order: Order, fee_rate_bps: int):
+        from py_clob_client.clob_types import OrderArgs
         
         api_args = {
             "token_id": order.token_id,
@@ -289,11 +690,38 @@ class RealTradingClient(TradingClient):
             "taker": "0x0000000000000000000000000000000000000000",
         }
         
-        order_args = OrderArgs(**api_args)
-        signed = self.client.create_order(order_args)
-        response = self.client.post_order(signed, OrderType.GTC)
+        return self.client.create_order(OrderArgs(**api_args))
+    
+    def submit_order(self, order: Order, fee_rate_bps: int) -> Dict:
+        from py_clob_client.clob_types import OrderType
         
-        return response
+        return self.client.post_order(self._sign(order, fee_rate_bps), OrderType.GTC)
+    
+    def submit_orders(self, orders: List[Tuple[Order, int]]) -> List[Dict]:
+        """Sign every order, then post them in as few batch requests as the CLOB allows."""
+        try:
+            from py_clob_client.clob_types import OrderType, PostOrdersArgs
+        except ImportError:
+            PostOrdersArgs = None
+        # Batch posting needs a newer py-clob-client; older ones submit one at a time
+        if PostOrdersArgs is None or not hasattr(self.client, "post_orders"):
+            return super().submit_orders(orders)
+        
+        responses: List[Dict] = []
+        for start in range(0, len(orders), MAX_BATCH_ORDERS):
+            chunk = orders[start:start + MAX_BATCH_ORDERS]
+            try:
+                batch = [PostOrdersArgs(order=self._sign(order, fee), orderType=OrderType.GTC)
+                         for order, fee in chunk]
+                posted = list(self.client.post_orders(batch))[:len(chunk)]
+            except Exception as e:
+                responses.extend({"success": False, "errorMsg": str(e)} for _ in chunk)
+                continue
+            responses.extend(posted)
+            # Orders the batch response left out are reported as failed, not dropped
+            responses.extend({"success": False, "errorMsg": "missing from batch response"}
+                             for _ in range(len(chunk) - len(posted)))
+        return responses
     
     def cancel_order(self, order_id: str) -> bool:
         try:
@@ -301,6 +729,14 @@ class RealTradingClient(TradingClient):
         except Exception:
             return False
     
+    def cancel_orders(self, order_ids: List[str]) -> List[str]:
+        if not order_ids:
+            return []
+        try:
+            return list(self.client.cancel_orders(order_ids).get("canceled") or [])
+        except Exception:
+            return []
+    
     def get_open_orders(self, market_id: Optional[str] = None) -> List[Order]:
         from py_clob_client.clob_types import OpenOrderParams
         
@@ -309,6 +745,7 @@ class RealTradingClient(TradingClient):
             orders = self.client.get_orders(params)
             
             result = []
+            now = time.time()
             for o in orders:
                 side = OrderSide.BUY if o.get("side", 0) == 0 else OrderSide.SELL
                 result.append(Order(
@@ -319,8 +756,8 @@ class RealTradingClient(TradingClient):
                     price=float(o.get("price", 0)),
                     size=float(o.get("size", 0)),
                     status=OrderStatus.OPEN,
-                    created_at=o.get("created_at", time.time()),
-                    expires_at=o.get("expiration", time.time() + 86400),
+                    created_at=o.get("created_at", now),
+                    expires_at=o.get("expiration", now + 86400),
                     nonce=o.get("nonce", 0),
                 ))
             return result
@@ -328,33 +765,39 @@ class RealTradingClient(TradingClient):
             return []
     
     def get_gas_price(self) -> float:
-        import httpx
-        try:
-            client = httpx.Client(timeout=5.0)
-            r = client.post(
-                "https://polygon-rpc.com",
-                json={"jsonrpc": "2.0", "method": "eth_gasPrice", "params": [], "id": 1}
-            )
-            if r.status_code == 200:
-                result = r.json().get("result", "0x0")
-                gas_wei = int(result, 16) if result.startswith("0x") else int(result)
-                client.close()
-                return gas_wei / 1e9
-            client.close()
-        except Exception:
-            pass
-        return DEFAULT_GAS_PRICE_GWEI
+        # Held across the fetch so concurrent callers share one eth_gasPrice call
+        with self._gas_lock:
+            cached = self._gas_cache.get("gwei")
+            if cached is not None:
+                return cached
+            try:
+                r = self._http.post(
+                    "https://polygon-rpc.com",
+                    json={"jsonrpc": "2.0", "method": "eth_gasPrice", "params": [], "id": 1},
+                    timeout=5.0,
+                )
+                if r.status_code == 200:
+                    result = orjson.loads(r.content).get("result", "0x0")
+                    gas_wei = int(result, 16) if result.startswith("0x") else int(result)
+                    self._gas_cache["gwei"] = gas_wei / 1e9
+                    return gas_wei / 1e9
+            except Exception:
+                pass
+            return DEFAULT_GAS_PRICE_GWEI
     
     def get_recent_trades(self, token_id: str, limit: int = 50) -> List[Dict]:
-        import httpx
+        key = (token_id, limit)
+        with self._trades_cache_lock:
+            trades = self._trades_cache.get(key)
+        if trades is not None:
+            return trades
         try:
-            client = httpx.Client(timeout=5.0)
-            r = client.get(f"{self.host}/trades", params={"token_id": token_id, "limit": limit})
+            r = self._http.get(f"{self.host}/trades", params={"token_id": token_id, "limit": limit}, timeout=5.0)
             if r.status_code == 200:
-                data = r.json()
-                client.close()
-                return data.get("trades", [])
-            client.close()
+                trades = orjson.loads(r.content).get("trades", [])
+                with self._trades_cache_lock:
+                    self._trades_cache[key] = trades
+                return trades
         except Exception:
             pass
         return []
@@ -367,17 +810,24 @@ class RealTradingClient(TradingClient):
             self._api_key, self._api_secret, self._api_passphrase = self.client.derive_api_key()
             
             self._ws_url = "wss://ws-subscriptions-clob.polymarket.com"
-            self._ws_running = True
             
+            # The reader thread only enqueues; parsing and fill dispatch run
+            # on a separate consumer so bursts don't stall the socket
             def on_message(ws, message):
-                try:
-                    data = json.loads(message)
-                    if data.get("type") == "order_filled" and self.fill_callback:
-                        self.fill_callback(data)
-                    elif data.get("type") == "trade" and self.fill_callback:
-                        self.fill_callback(data)
-                except Exception:
-                    pass
+                self._ws_inbox.put(message)
+            
+            def consume():
+                while (message := self._ws_inbox.get()) is not None:
+                    try:
+                        data = orjson.loads(message)
+                        if data.get("type") == "order_filled" and self.fill_callback:
+                            self.fill_callback(data)
+                            self.wake.set()
+                        elif data.get("type") == "trade" and self.fill_callback:
+                            self.fill_callback(data)
+                            self.wake.set()
+                    except Exception:
+                        pass
             
             def on_error(ws, error):
                 pass
@@ -386,18 +836,17 @@ class RealTradingClient(TradingClient):
                 self._ws_running = False
             
             def on_open(ws):
+                self._ws_running = True
+                self._ws_opened = True
                 auth = {"apiKey": self._api_key, "secret": self._api_secret, "passphrase": self._api_passphrase}
                 ws.send(json.dumps({"type": "user", "auth": auth}))
-                
-                def ping():
-                    while self._ws_running:
-                        try:
-                            ws.send("PING")
-                        except Exception:
-                            break
-                        time.sleep(10)
-                
-                threading.Thread(target=ping, daemon=True).start()
+                # After a reconnect, pick up every token subscribed so far
+                if self._subscribed_tokens:
+                    ws.send(json.dumps({
+                        "type": "subscribe",
+                        "assets_ids": list(self._subscribed_tokens),
+                        "operation": "subscribe"
+                    }))
             
             self._ws = WebSocketApp(
                 self._ws_url + "/ws/user",
@@ -407,92 +856,124 @@ class RealTradingClient(TradingClient):
                 on_open=on_open,
             )
             
-            self._ws_thread = threading.Thread(target=self._ws.run_forever, daemon=True)
+            def connect() -> bool:
+                self._ws_opened = False
+                try:
+                    # Control-frame pings detect a dead peer; the text PING
+                    # below is the channel's own keepalive
+                    self._ws.run_forever(ping_interval=WS_PING_INTERVAL_S, ping_timeout=WS_PING_TIMEOUT_S)
+                except Exception:
+                    pass
+                self._ws_running = False
+                return self._ws_opened
+            
+            self._ws_thread = threading.Thread(target=keep_connected, args=(connect, self._ws_stopped), daemon=True)
             self._ws_thread.start()
+            threading.Thread(
+                target=heartbeat, args=(lambda: self._ws if self._ws_running else None, self._ws_stopped), daemon=True,
+            ).start()
+            threading.Thread(target=consume, daemon=True).start()
             
         except Exception as e:
             pass
     
-    def subscribe_token(self, token_id: str):
-        if token_id not in self._subscribed_tokens and self._ws:
-            self._subscribed_tokens.add(token_id)
-            try:
-                import json
-                self._ws.send(json.dumps({
-                    "type": "subscribe",
-                    "assets_ids": [token_id],
-                    "operation": "subscribe"
-                }))
-            except Exception:
-                pass
+    def subscribe_tokens(self, token_ids: List[str]):
+        """Subscribe to fills for every new token in one frame."""
+        if not self._ws:
+            return
+        new = [t for t in dict.fromkeys(token_ids) if t not in self._subscribed_tokens]
+        if not new:
+            return
+        self._subscribed_tokens.update(new)
+        try:
+            import json
+            self._ws.send(json.dumps({
+                "type": "subscribe",
+                "assets_ids": new,
+                "operation": "subscribe"
+            }))
+        except Exception:
+            pass
     
     def stop_ws(self):
         self._ws_running = False
+        self._ws_stopped.set()
+        self._ws_inbox.put(None)
+        self._book_feed.stop()
         if self._ws:
             try:
                 self._ws.close()
             except Exception:
                 pass
+    
+    def close(self):
+        self.stop_ws()
+        self._http.close()
 
 
 class SandboxTradingClient(TradingClient):
-    def __init__(self):
+    # Built once and shared; Market fields are never mutated after construction
+    FALLBACK_MARKETS = (
+        Market("btc_15m_fallback", "Will BTC > $98,000 in next 15m?",
+               ["0xY_btc_fallback", "0xN_btc_fallback"], 156, 15000, "", ""),
+        Market("eth_15m_fallback", "Will ETH > $3,200 in next 15m?",
+               ["0xY_eth_fallback", "0xN_eth_fallback"], 156, 12000, "", ""),
+    )
+    
+    def __init__(self, hot: bool = False, pin_core: Optional[int] = None):
         self.host = "https://clob.polymarket.com"
-        self._nonce = 0
-        self._nonce_lock = threading.Lock()
-        self._order_counter = 0
-        self._ws_fills: List[Dict] = []
+        self._next_nonce = itertools.count().__next__
+        self._next_order_no = itertools.count(1).__next__
+        self._ws_fills: Dict[str, Dict] = {}
         self._ws_fills_lock = threading.Lock()
+        self._fees: TTLCache = TTLCache(maxsize=FEE_CACHE_SIZE, ttl=FEE_CACHE_TTL_S)
+        self._fees_lock = threading.Lock()
+        self._http = make_http_client()
+        self._book_feed = MarketBookFeed(hot=hot, pin_core=pin_core)
+        self.wake = self._book_feed.wake
         print("   Sandbox mode initialized (real data, simulated fills)")
     
     def get_nonce(self) -> int:
-        with self._nonce_lock:
-            n = self._nonce
-            self._nonce += 1
-        return n
+        return self._next_nonce()
     
     def _gen_order_id(self) -> str:
-        self._order_counter += 1
-        return f"sim_{self._order_counter}_{int(time.time()*1000)}_{random.randint(1000,9999)}"
+        # Unique within the run, which is as long as a simulated order lives
+        return f"sim_{self._next_order_no()}"
     
     def get_markets(self) -> List[Market]:
         """Fetch real 15-min crypto markets from Polymarket API."""
-        import httpx
         markets = []
-        client = httpx.Client(timeout=10.0)
         
         try:
-            r = client.get(
+            r = self._http.get(
                 "https://gamma-api.polymarket.com/events",
                 params={"status": "active", "limit": 100}
             )
             if r.status_code != 200:
                 return self._get_fallback_markets()
             
-            data = r.json()
+            data = orjson.loads(r.content)
             events = data if isinstance(data, list) else data.get("events", [])
             
             for event in events:
                 if not event.get("markets"):
                     continue
                 
-                market_data = event["markets"][0]
-                question = market_data.get("question", "").lower()
-                tags_raw = event.get("tags", [])
                 volume = event.get("volume") or 0
+                if volume < MIN_VOLUME_USD:
+                    continue
+                
+                market_data = event["markets"][0]
+                title = market_data.get("question", "")
+                question = title.lower()
                 
                 # Tags can be dicts or strings
-                tags = []
-                for t in tags_raw:
-                    if isinstance(t, dict):
-                        tags.append(t.get("label", "").lower())
-                    else:
-                        tags.append(str(t).lower())
+                tags = {
+                    t.get("label", "").lower() if isinstance(t, dict) else str(t).lower()
+                    for t in event.get("tags", [])
+                }
                 
-                crypto_kw = ["btc", "bitcoin", "eth", "ethereum", "sol", "solana", "crypto"]
-                if not any(kw in question or kw in tags for kw in crypto_kw):
-                    continue
-                if volume < MIN_VOLUME_USD:
+                if not (CRYPTO_KEYWORDS_RE.search(question) or tags & CRYPTO_KEYWORDS):
                     continue
                 
                 # Check for 15-min duration
@@ -513,8 +994,7 @@ class SandboxTradingClient(TradingClient):
                 clob_tokens = market_data.get("clobTokenIds", "")
                 if clob_tokens:
                     try:
-                        import json
-                        token_ids = json.loads(clob_tokens)
+                        token_ids = orjson.loads(clob_tokens)
                     except:
                         pass
                 if not token_ids:
@@ -525,7 +1005,7 @@ class SandboxTradingClient(TradingClient):
                 
                 markets.append(Market(
                     condition_id=market_data.get("conditionId", ""),
-                    question=market_data.get("question", "")[:100],
+                    question=title[:100],
                     tokens=token_ids,
                     fee_bps=0,
                     volume_24h=volume,
@@ -534,103 +1014,82 @@ class SandboxTradingClient(TradingClient):
                 ))
         except Exception as e:
             pass
-        finally:
-            client.close()
         
         if not markets:
             return self._get_fallback_markets()
+        self._book_feed.subscribe([t for m in markets for t in m.tokens])
         return markets
     
     def _get_fallback_markets(self) -> List[Market]:
         """Return hardcoded fallback markets if API fails."""
-        return [
-            Market("btc_15m_fallback", "Will BTC > $98,000 in next 15m?",
-                   ["0xY_btc_fallback", "0xN_btc_fallback"], 156, 15000, "", ""),
-            Market("eth_15m_fallback", "Will ETH > $3,200 in next 15m?",
-                   ["0xY_eth_fallback", "0xN_eth_fallback"], 156, 12000, "", ""),
-        ]
+        return list(self.FALLBACK_MARKETS)
+    
+    def cached_orderbook(self, token_id: str) -> Optional[OrderBook]:
+        return self._book_feed.get(token_id)
     
     def get_orderbook(self, token_id: str) -> OrderBook:
-        """Fetch real orderbook from Polymarket CLOB."""
-        import httpx
+        """Real orderbook from the market feed, falling back to REST until it arrives."""
+        book = self._book_feed.get(token_id)
+        if book is not None:
+            return book
+        
         try:
-            client = httpx.Client(timeout=5.0)
-            r = client.get(f"{self.host}/orderbook", params={"token_id": token_id, "limit": 20})
+            r = self._http.get(f"{self.host}/orderbook", params={"token_id": token_id, "limit": 20},
+                               timeout=BOOK_TIMEOUT_S)
             
             if r.status_code == 200:
-                data = r.json()
-                bids = [{"price": float(b.get("price", 0)), "size": float(b.get("size", 0))} 
-                        for b in data.get("bids", [])]
-                asks = [{"price": float(a.get("price", 0)), "size": float(a.get("size", 0))} 
-                        for a in data.get("asks", [])]
-                
-                client.close()
-                
-                if bids and asks:
-                    mid = (bids[0]["price"] + asks[0]["price"]) / 2
-                    spread = (asks[0]["price"] - bids[0]["price"]) / mid * 10000
-                else:
-                    mid, spread = 0.5, 0
-                
-                return OrderBook(bids=bids, asks=asks, midpoint=mid, spread_bps=spread)
-            
-            client.close()
+                data = orjson.loads(r.content)
+                return OrderBook.from_levels(
+                    [(float(b.get("price", 0)), float(b.get("size", 0))) for b in data.get("bids", [])],
+                    [(float(a.get("price", 0)), float(a.get("size", 0))) for a in data.get("asks", [])],
+                )
         except Exception:
             pass
         
-        return OrderBook(bids=[], asks=[])
+        return OrderBook()
     
     def get_fee_rate(self, token_id: str) -> int:
         """Fetch real fee rate from Polymarket API."""
-        import httpx
+        with self._fees_lock:
+            fee = self._fees.get(token_id)
+        if fee is not None:
+            return fee
         try:
-            client = httpx.Client(timeout=5.0)
-            r = client.get(f"{self.host}/fee-rate", params={"token_id": token_id})
+            r = self._http.get(f"{self.host}/fee-rate", params={"token_id": token_id}, timeout=BOOK_TIMEOUT_S)
             
             if r.status_code == 200:
-                fee = r.json().get("fee_rate_bps", 0)
-                client.close()
+                fee = orjson.loads(r.content).get("fee_rate_bps", 0)
+                with self._fees_lock:
+                    self._fees[token_id] = fee
                 return fee
-            
-            client.close()
         except Exception:
             pass
         return 156
     
     def get_recent_trades(self, token_id: str, limit: int = 50) -> List[Dict]:
         """Fetch real recent trades from Polymarket."""
-        import httpx
         try:
-            client = httpx.Client(timeout=5.0)
-            r = client.get(f"{self.host}/trades", params={"token_id": token_id, "limit": limit})
+            r = self._http.get(f"{self.host}/trades", params={"token_id": token_id, "limit": limit}, timeout=5.0)
             
             if r.status_code == 200:
-                data = r.json()
-                client.close()
-                return data.get("trades", [])
-            
-            client.close()
+                return orjson.loads(r.content).get("trades", [])
         except Exception:
             pass
         return []
     
     def get_gas_price(self) -> float:
         """Fetch real gas price from Polygon RPC."""
-        import httpx
         try:
-            client = httpx.Client(timeout=5.0)
-            r = client.post(
+            r = self._http.post(
                 "https://polygon-rpc.com",
-                json={"jsonrpc": "2.0", "method": "eth_gasPrice", "params": [], "id": 1}
+                json={"jsonrpc": "2.0", "method": "eth_gasPrice", "params": [], "id": 1},
+                timeout=5.0,
             )
             
             if r.status_code == 200:
-                result = r.json().get("result", "0x0")
+                result = orjson.loads(r.content).get("result", "0x0")
                 gas_wei = int(result, 16) if result.startswith("0x") else int(result)
-                client.close()
                 return gas_wei / 1e9
-            
-            client.close()
         except Exception:
             pass
         return DEFAULT_GAS_PRICE_GWEI
@@ -648,28 +1107,60 @@ class SandboxTradingClient(TradingClient):
         """Simulate order cancellation (no real blockchain tx)."""
         return True
     
+    def cancel_orders(self, order_ids: List[str]) -> List[str]:
+        """Simulate a batch cancellation (no real blockchain tx)."""
+        return list(order_ids)
+    
     def get_open_orders(self, market_id: Optional[str] = None) -> List[Order]:
         """No real orders in sandbox."""
         return []
     
-    def subscribe_token(self, token_id: str):
+    def subscribe_tokens(self, token_ids: List[str]):
         """Subscribe to token trades for fill simulation."""
         pass
     
     def stop_ws(self):
-        pass
+        self._book_feed.stop()
+    
+    def close(self):
+        self.stop_ws()
+        self._http.close()
 
 
 class OrderManager:
-    def __init__(self, client: TradingClient, rebate_rate: float = 0.20):
+    __slots__ = (
+        "client", "rebate_rate", "_rebate_coef", "_random",
+        "pending", "open", "open_by_token", "_age_heap", "filled", "cancelled",
+        "_mkt_idx", "inv_yes", "inv_no", "_sim_checked",
+        "placed", "filled_count", "cancelled_count", "gas_spent", "gas_lock",
+        "_is_sandbox", "_get_gas_price", "_ws_fills", "_ws_fills_lock",
+        "_net_exp", "_exp_mids", "_exposure_dirty", "io_pool",
+    )
+    
+    def __init__(self, client: TradingClient, rebate_rate: float = 0.20, seed: Optional[int] = None,
+                 io_pool: Optional[Executor] = None):
         self.client = client
+        # Shared worker pool for REST book lookups when checking fills
+        self.io_pool = io_pool
         self.rebate_rate = rebate_rate
+        # Rebate per (qty * price * fee_bps), so each fill is two multiplies
+        self._rebate_coef = rebate_rate / 10000
+        # Simulated fill draws; seed it to replay a sandbox run exactly
+        self._random = random.Random(seed).random
+        # Last simulated fill check per market, to scale fill odds by elapsed time
+        self._sim_checked: Dict[str, float] = {}
         
         self.pending: Dict[str, Order] = {}
         self.open: Dict[str, Order] = {}
+        # Indexes over self.open; heap entries whose order is gone are skipped
+        self.open_by_token: Dict[str, Set[str]] = defaultdict(set)
+        self._age_heap: List[Tuple[float, str]] = []
         self.filled: List[Order] = []
         self.cancelled: List[Order] = []
-        self.inventory: Dict[str, Dict[str, float]] = defaultdict(lambda: {"YES": 0.0, "NO": 0.0})
+        # YES/NO token inventory as parallel columns, one slot per market
+        self._mkt_idx: Dict[str, int] = {}
+        self.inv_yes = array("d")
+        self.inv_no = array("d")
         
         self.placed = 0
         self.filled_count = 0
@@ -677,75 +1168,111 @@ class OrderManager:
         self.gas_spent = 0.0
         self.gas_lock = threading.Lock()
         
-        self._ws_fills: List[Dict] = []
+        self._is_sandbox = isinstance(client, SandboxTradingClient)
+        self._get_gas_price = client.get_gas_price
+        
+        # Pending WS fill events, keyed by order id
+        self._ws_fills: Dict[str, Dict] = {}
         self._ws_fills_lock = threading.Lock()
         
+        # Net exposure cached against the mids it was priced with
+        self._net_exp = 0.0
+        self._exp_mids: Optional[Dict[str, float]] = None
+        self._exposure_dirty = True
+        
         self._setup_ws_callback()
     
     def _setup_ws_callback(self):
         if hasattr(self.client, 'fill_callback') and self.client.fill_callback:
             pass
-        elif hasattr(self.client, 'subscribe_token'):
+        elif hasattr(self.client, 'subscribe_tokens'):
             def on_fill(data):
-                with self._ws_fills_lock:
-                    self._ws_fills.append(data)
+                order_id = data.get("order_id") or data.get("orderId")
+                if order_id:
+                    with self._ws_fills_lock:
+                        self._ws_fills[order_id] = data
             self.client.fill_callback = on_fill
     
     def calc_fill_prob(self, order: Order, book: OrderBook, volume: float, size_usd: float) -> float:
-        if book.bids and book.asks:
-            if order.side == OrderSide.BUY:
-                depth_ahead = sum(a["size"] for a in book.asks if a["price"] <= order.price)
+        if book.bid_prices and book.ask_prices:
+            if order.side is OrderSide.BUY:
+                depth_ahead = book.ask_depth_upto(order.price_ticks)
             else:
-                depth_ahead = sum(b["size"] for b in book.bids if b["price"] >= order.price)
+                depth_ahead = book.bid_depth_downto(order.price_ticks)
         else:
             depth_ahead = 0
         
         queue_factor = max(0.05, min(0.95, order.size / (depth_ahead + order.size + 10)))
         vol_factor = min(1.0, volume / (size_usd * 100))
-        spread_factor = 1.2 if book.spread_bps < 50 else (0.8 if book.spread_bps > 200 else 1.0)
+        spread = book.spread_bps
+        # 1.2 below 50 bps, 1.0 up to 200 bps, 0.8 beyond
+        spread_factor = (1.2, 1.0, 0.8)[(spread >= 50) + (spread > 200)]
         
         prob = 0.03 * queue_factor * vol_factor * spread_factor
         return max(0.001, min(0.20, prob))
     
-    def submit_order(self, market: Market, side: OrderSide, price: float, size: float, 
-                     fee_rate_bps: int, expiry_secs: int = 300) -> Optional[Order]:
-        order = Order(
+    def _new_order(self, market: Market, side: OrderSide, price: float, size: float,
+                   expiry_secs: int, now: float) -> Order:
+        return Order(
             order_id="", market_id=market.condition_id,
-            token_id=market.tokens[0] if side == OrderSide.BUY else market.tokens[1],
+            token_id=market.tokens[side is OrderSide.SELL],  # [YES, NO]
             side=side, price=price, size=size, status=OrderStatus.PENDING,
-            created_at=time.time(), expires_at=time.time() + expiry_secs,
+            created_at=now, expires_at=now + expiry_secs,
             nonce=self.client.get_nonce(),
         )
+    
+    def _on_submitted(self, order: Order, resp: Dict) -> Optional[Order]:
+        if not resp.get("success"):
+            return None
+        order.order_id = resp.get("orderID") or f"local_{order.nonce}"
+        order.status = OrderStatus.OPEN
+        self.open[order.order_id] = order
+        self.open_by_token[order.token_id].add(order.order_id)
+        heapq.heappush(self._age_heap, (order.created_at, order.order_id))
+        self.placed += 1
         
+        if not self._is_sandbox:
+            gas_usd = self._get_gas_price() * GAS_PLACE_USD_PER_GWEI
+            with self.gas_lock:
+                self.gas_spent += gas_usd
+        return order
+    
+    def submit_order(self, market: Market, side: OrderSide, price: float, size: float, 
+                     fee_rate_bps: int, expiry_secs: int = 300) -> Optional[Order]:
+        order = self._new_order(market, side, price, size, expiry_secs, time.time())
         try:
-            resp = self.client.submit_order(order, fee_rate_bps)
-            if resp.get("success"):
-                order.order_id = resp.get("orderID", f"sim_{int(time.time()*1000)}")
-                order.status = OrderStatus.OPEN
-                self.open[order.order_id] = order
-                self.placed += 1
-                
-                if not isinstance(self.client, SandboxTradingClient):
-                    gas_usd = self.client.get_gas_price() * 0.05 * 0.80
-                    with self.gas_lock:
-                        self.gas_spent += gas_usd
-                return order
-            return None
+            return self._on_submitted(order, self.client.submit_order(order, fee_rate_bps))
         except Exception as e:
             print(f"   Order failed: {e}")
             return None
     
+    def submit_orders(self, quotes: List[Tuple[Market, OrderSide, float, float, int, int]]) -> List[Optional[Order]]:
+        """Batch version of submit_order over (market, side, price, size, fee_rate_bps, expiry_secs)."""
+        now = time.time()
+        orders = [self._new_order(m, side, price, size, expiry, now) for m, side, price, size, _, expiry in quotes]
+        try:
+            responses = self.client.submit_orders([(o, q[4]) for o, q in zip(orders, quotes)])
+        except Exception as e:
+            print(f"   Order failed: {e}")
+            return [None] * len(orders)
+        if len(responses) != len(orders):
+            print(f"   Order failed: {len(responses)} responses for {len(orders)} orders")
+        # One entry per quote, so callers can zip the result with their quotes
+        results = [self._on_submitted(o, resp) for o, resp in zip(orders, responses)]
+        results.extend([None] * (len(orders) - len(results)))
+        return results
+    
     def cancel_order(self, order_id: str) -> bool:
         if order_id not in self.open:
             return False
         try:
             if self.client.cancel_order(order_id):
-                order = self.open.pop(order_id)
+                order = self._pop_open(order_id)
                 order.status = OrderStatus.CANCELLED
                 self.cancelled.append(order)
                 self.cancelled_count += 1
-                if not isinstance(self.client, SandboxTradingClient):
-                    gas_usd = self.client.get_gas_price() * 0.03 * 0.80
+                if not self._is_sandbox:
+                    gas_usd = self._get_gas_price() * GAS_CANCEL_USD_PER_GWEI
                     with self.gas_lock:
                         self.gas_spent += gas_usd
                 return True
@@ -757,17 +1284,42 @@ class OrderManager:
         fills = []
         now = time.time()
         
-        for oid, order in list(self.open.items()):
-            if now > order.expires_at:
-                order.status = OrderStatus.EXPIRED
-                self.open.pop(oid)
+        # Scan pass: split this market's orders into live and expired, then
+        # retire the expired ones once the per-token sets are no longer
+        # being iterated
+        live = []
+        expired = []
+        for token_id in market.tokens:
+            for oid in self.open_by_token.get(token_id, ()):
+                order = self.open.get(oid)
+                if order is not None:
+                    (expired if now > order.expires_at else live).append((oid, order))
+        for oid, order in expired:
+            order.status = OrderStatus.EXPIRED
+            self._pop_open(oid)
+        if not live:
+            return fills
+        
+        simulated = self._is_sandbox
+        if simulated:
+            last_check = self._sim_checked.get(market.condition_id, now - CYCLE_PERIOD_S)
+            self._sim_checked[market.condition_id] = now
+        books = self.client.get_orderbooks(list({order.token_id for _, order in live}), self.io_pool)
+        trade_index: Dict[str, Dict[str, Tuple[List[int], List[Dict]]]] = {}
+        
+        for oid, order in live:
+            if oid not in self.open:
                 continue
             
-            book = self.client.get_orderbook(order.token_id)
+            book = books[order.token_id]
             
-            if isinstance(self.client, SandboxTradingClient):
+            if simulated:
                 prob = self.calc_fill_prob(order, book, market.volume_24h, order.size * order.price)
-                if random.random() < prob:
+                # prob is per CYCLE_PERIOD_S; cycles run early on feed wakeups,
+                # so convert it to the time this order has actually been exposed
+                exposed = max(0.0, now - max(last_check, order.created_at))
+                prob = 1.0 - (1.0 - prob) ** (exposed / CYCLE_PERIOD_S)
+                if self._random() < prob:
                     fills.append({
                         "order_id": oid,
                         "side": order.side.value,
@@ -779,92 +1331,237 @@ class OrderManager:
                     order.filled_price = order.price
                     order.status = OrderStatus.FILLED
                     self.filled.append(order)
-                    self.open.pop(oid)
+                    self._pop_open(oid)
                     self.filled_count += 1
-                    self.inventory[order.market_id]["YES" if order.side == OrderSide.BUY else "NO"] += order.size
+                    self._add_inventory(order)
             else:
-                ws_fills_processed = False
                 with self._ws_fills_lock:
-                    for fill_data in self._ws_fills[:]:
-                        order_id = fill_data.get("order_id") or fill_data.get("orderId")
-                        if order_id and order_id in self.open:
-                            order = self.open[order_id]
-                            fills.append({
-                                "order_id": order_id,
-                                "side": order.side.value,
-                                "filled_qty": float(fill_data.get("size", order.size)),
-                                "filled_price": float(fill_data.get("price", order.price)),
-                                "rebate": self._calc_rebate(float(fill_data.get("size", order.size)),
-                                                             float(fill_data.get("price", order.price)), market.fee_bps),
-                            })
-                            order.filled_qty = float(fill_data.get("size", order.size))
-                            order.filled_price = float(fill_data.get("price", order.price))
-                            order.status = OrderStatus.FILLED
-                            self.filled.append(order)
-                            self.open.pop(order_id)
-                            self.filled_count += 1
-                            self.inventory[order.market_id]["YES" if order.side == OrderSide.BUY else "NO"] += order.size
-                            self._ws_fills.remove(fill_data)
-                            ws_fills_processed = True
+                    fill_data = self._ws_fills.pop(oid, None)
                 
-                if not ws_fills_processed:
-                    for trade in self.client.get_recent_trades(order.token_id, 20):
-                        if self._trade_matches(trade, order):
-                            fills.append({
-                                "order_id": oid,
-                                "side": order.side.value,
-                                "filled_qty": float(trade.get("size", 0)),
-                                "filled_price": float(trade.get("price", order.price)),
-                                "rebate": self._calc_rebate(float(trade.get("size", 0)), 
-                                                             float(trade.get("price", order.price)), market.fee_bps),
-                            })
-                            self.filled.append(order)
-                            self.open.pop(oid)
-                            self.filled_count += 1
-                            self.inventory[order.market_id]["YES" if order.side == OrderSide.BUY else "NO"] += order.size
-                            break
+                if fill_data is not None:
+                    filled_qty = float(fill_data.get("size", order.size))
+                    filled_price = float(fill_data.get("price", order.price))
+                    fills.append({
+                        "order_id": oid,
+                        "side": order.side.value,
+                        "filled_qty": filled_qty,
+                        "filled_price": filled_price,
+                        "rebate": self._calc_rebate(filled_qty, filled_price, market.fee_bps),
+                    })
+                    order.filled_qty = filled_qty
+                    order.filled_price = filled_price
+                    order.status = OrderStatus.FILLED
+                    self.filled.append(order)
+                    self._pop_open(oid)
+                    self.filled_count += 1
+                    self._add_inventory(order)
+                else:
+                    index = trade_index.get(order.token_id)
+                    if index is None:
+                        index = trade_index[order.token_id] = self._index_trades(
+                            self.client.get_recent_trades(order.token_id, 20))
+                    trade = self._matching_trade(index, order)
+                    if trade is not None:
+                        fills.append({
+                            "order_id": oid,
+                            "side": order.side.value,
+                            "filled_qty": float(trade.get("size", 0)),
+                            "filled_price": float(trade["price"]),
+                            "rebate": self._calc_rebate(float(trade.get("size", 0)), 
+                                                         float(trade["price"]), market.fee_bps),
+                        })
+                        self.filled.append(order)
+                        self._pop_open(oid)
+                        self.filled_count += 1
+                        self._add_inventory(order)
         
         return fills
     
-    def _trade_matches(self, trade: Dict, order: Order) -> bool:
-        trade_side = trade.get("side", "")
-        if order.side == OrderSide.BUY and trade_side != "SELL":
-            return False
-        if order.side == OrderSide.SELL and trade_side != "BUY":
-            return False
-        return True
+    def _market_index(self, market_id: str) -> int:
+        i = self._mkt_idx.get(market_id)
+        if i is None:
+            i = self._mkt_idx[market_id] = len(self.inv_yes)
+            self.inv_yes.append(0.0)
+            self.inv_no.append(0.0)
+        return i
+    
+    def _add_inventory(self, order: Order):
+        i = self._market_index(order.market_id)
+        is_buy = order.side is OrderSide.BUY
+        if is_buy:
+            self.inv_yes[i] += order.size
+        else:
+            self.inv_no[i] += order.size
+        
+        # Move the cached exposure by this fill alone, at the same mid
+        # net_exposure priced this market with
+        if self._exp_mids is None or self._exposure_dirty:
+            self._exposure_dirty = True
+        else:
+            mid = self._exp_mids.get(order.market_id, 0.5)
+            self._net_exp += order.size * mid if is_buy else -order.size * mid
+    
+    def position(self, market_id: str) -> Tuple[float, float]:
+        """(YES, NO) token quantities held in a market."""
+        i = self._mkt_idx.get(market_id)
+        if i is None:
+            return 0.0, 0.0
+        return self.inv_yes[i], self.inv_no[i]
+    
+    def _pop_open(self, order_id: str) -> Order:
+        order = self.open.pop(order_id)
+        token_orders = self.open_by_token.get(order.token_id)
+        if token_orders is not None:
+            token_orders.discard(order_id)
+            if not token_orders:
+                del self.open_by_token[order.token_id]
+        return order
+    
+    def _index_trades(self, trades: List[Dict]) -> Dict[str, Tuple[List[int], List[Dict]]]:
+        """Group trades by side, each sorted by price ticks for bisect lookups."""
+        by_side: Dict[str, List[Tuple[int, Dict]]] = {"BUY": [], "SELL": []}
+        for trade in trades:
+            entries = by_side.get(trade.get("side", ""))
+            if entries is not None and trade.get("price") is not None:
+                entries.append((to_ticks(float(trade["price"])), trade))
+        index = {}
+        for side, entries in by_side.items():
+            entries.sort(key=lambda e: e[0])
+            index[side] = ([t for t, _ in entries], [trade for _, trade in entries])
+        return index
+    
+    def _matching_trade(self, index: Dict[str, Tuple[List[int], List[Dict]]], order: Order) -> Optional[Dict]:
+        """Opposite-side trade at or through the order's price, closest to it."""
+        if order.side is OrderSide.BUY:
+            ticks, trades = index["SELL"]
+            i = bisect.bisect_right(ticks, order.price_ticks)
+            return trades[i - 1] if i else None
+        ticks, trades = index["BUY"]
+        i = bisect.bisect_left(ticks, order.price_ticks)
+        return trades[i] if i < len(trades) else None
     
     def _calc_rebate(self, qty: float, price: float, fee_bps: int) -> float:
-        return qty * price * fee_bps / 10000 * self.rebate_rate
-    
-    def net_exposure(self, markets: List[Market]) -> float:
-        exp = 0.0
-        for m in markets:
-            inv = self.inventory.get(m.condition_id, {"YES": 0.0, "NO": 0.0})
-            mid = self.client.get_orderbook(m.tokens[0]).midpoint
-            exp += inv["YES"] * mid - inv["NO"] * mid
+        return qty * price * fee_bps * self._rebate_coef
+    
+    def net_exposure(self, mids: Dict[str, float]) -> float:
+        """Net inventory value at this cycle's mids (0.5 where unknown); reused until mids change."""
+        if mids is self._exp_mids and not self._exposure_dirty:
+            return self._net_exp
+        
+        yes, no, get = self.inv_yes, self.inv_no, mids.get
+        exp = sum((yes[i] - no[i]) * get(market_id, 0.5) for market_id, i in self._mkt_idx.items())
+        
+        self._net_exp, self._exp_mids, self._exposure_dirty = exp, mids, False
         return exp
     
     def cancel_stale(self, max_age: int) -> int:
+        cutoff = time.time() - max_age
+        stale = []
+        while self._age_heap and self._age_heap[0][0] < cutoff:
+            entry = heapq.heappop(self._age_heap)
+            if entry[1] in self.open:
+                stale.append(entry)
+        if not stale:
+            return 0
+        
+        # One batch request for every stale order
+        try:
+            done = set(self.client.cancel_orders([oid for _, oid in stale]))
+        except Exception:
+            done = set()
+        
         cancelled = 0
-        now = time.time()
-        for oid in list(self.open.keys()):
-            if now - self.open[oid].created_at > max_age:
-                if self.cancel_order(oid):
-                    cancelled += 1
+        for entry in stale:
+            oid = entry[1]
+            if oid not in done:
+                heapq.heappush(self._age_heap, entry)
+                continue
+            order = self._pop_open(oid)
+            order.status = OrderStatus.CANCELLED
+            self.cancelled.append(order)
+            cancelled += 1
+        self.cancelled_count += cancelled
+        
+        if cancelled and not self._is_sandbox:
+            gas_usd = self._get_gas_price() * GAS_CANCEL_USD_PER_GWEI * cancelled
+            with self.gas_lock:
+                self.gas_spent += gas_usd
         return cancelled
 
 
+def pin_thread(cpus: Set[int]) -> bool:
+    """Restrict the calling thread to cpus; False where unsupported."""
+    try:
+        os.sched_setaffinity(0, cpus)
+        return True
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def make_realtime() -> str:
+    """Raise the calling thread's scheduling priority as far as permitted.
+
+    Threads it starts afterwards come up at normal priority (SCHED_RESET_ON_FORK).
+    """
+    reset = getattr(os, "SCHED_RESET_ON_FORK", 0)
+    try:
+        os.sched_setscheduler(0, os.SCHED_FIFO | reset, os.sched_param(50))
+        return "SCHED_FIFO"
+    except (AttributeError, OSError):
+        pass
+    try:
+        # Also resets a negative nice value to 0 in threads started later
+        os.sched_setscheduler(0, os.SCHED_OTHER | reset, os.sched_param(0))
+    except (AttributeError, OSError):
+        pass
+    try:
+        os.nice(-10)
+        return "nice -10"
+    except (AttributeError, OSError):
+        return "default"
+
+
+def init_io_worker(cpus: Optional[Set[int]]):
+    """Run an I/O pool worker at normal priority, restricted to cpus if given.
+
+    Workers are started from the loop thread, whose make_realtime() policy
+    they would otherwise inherit.
+    """
+    try:
+        os.sched_setscheduler(0, os.SCHED_OTHER, os.sched_param(0))
+    except (AttributeError, OSError):
+        pass
+    if cpus:
+        pin_thread(cpus)
+
+
+def parse_capital(argv: List[str], default: float = 60.0) -> float:
+    """Capital from argv[1], or the default if it is missing or not a positive number."""
+    try:
+        capital = float(argv[1])
+    except (IndexError, ValueError):
+        return default
+    return capital if 0 < capital < float("inf") else default
+
+
 def main():
-    capital = float(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1].replace('.','').isdigit() else 60
+    capital = parse_capital(sys.argv)
     
-    aggro = "3"
-    for a in ["1", "2", "3"]:
-        if a in sys.argv:
-            aggro = a
-            break
+    # --aggro=N wins; otherwise a bare 1/2/3 after the capital argument
+    args = set(sys.argv[2:])
+    aggro = next((a.split("=", 1)[1] for a in sys.argv if a.startswith("--aggro=")), None)
+    if aggro not in AGGRO:
+        aggro = next((a for a in AGGRO if a in args), "3")
     
     sandbox = "--sandbox" in sys.argv or "-s" in sys.argv or "--real" not in sys.argv
+    hot = "--hot" in sys.argv
+    pin_arg = next((a.split("=", 1)[1] for a in sys.argv if a.startswith("--pin=")), None)
+    pin_core = None
+    if pin_arg is not None:
+        try:
+            pin_core = int(pin_arg)
+        except ValueError:
+            print(f"  Invalid --pin={pin_arg}, running unpinned")
     
     preset = AGGRO[aggro]
     order_size_usd = round(capital * preset["pct"], 2)
@@ -872,6 +1569,11 @@ def main():
     lifetime = preset["order_lifetime_s"]
     max_per_mkt = capital * MAX_PER_MARKET_PCT
     max_net = capital * MAX_NET_EXPOSURE_PCT
+    # Remaining per-run constants for the market loop
+    skew_denom = capital + 1
+    inv_room = max_inv_usd - order_size_usd
+    pricing_cfg = PricingConfig()
+    buy_stop, sell_stop = pricing_cfg.buy_stop_threshold, pricing_cfg.sell_stop_threshold
     
     print("=" * 60)
     print("  POLYMR - Market Making Bot")
@@ -881,14 +1583,20 @@ def main():
     print("=" * 60)
     
     try:
-        client = SandboxTradingClient() if sandbox else RealTradingClient()
+        client = (SandboxTradingClient(hot=hot, pin_core=pin_core) if sandbox
+                  else RealTradingClient(hot=hot, pin_core=pin_core))
     except ValueError as e:
         print(f"  {e}")
         print("  Falling back to sandbox...")
-        client = SandboxTradingClient()
+        client = SandboxTradingClient(hot=hot, pin_core=pin_core)
         sandbox = True
     
-    mgr = OrderManager(client, rebate_rate=MAKER_REBATE_RATE)
+    can_subscribe = hasattr(client, 'subscribe_tokens')
+    # Quotes decided this cycle, with their market's index, submitted in one
+    # batch after the market loop; their tokens are then subscribed together
+    quotes: List[Tuple[Market, OrderSide, float, float, int, int]] = []
+    quote_idx: List[int] = []
+    new_tokens: List[str] = []
     
     print("  Fetching markets...")
     markets = client.get_markets()
@@ -896,42 +1604,99 @@ def main():
         markets = client.get_markets()
     print(f"  Found {len(markets)} eligible markets")
     
-    open_orders = {m.condition_id: {"BUY": None, "SELL": None} for m in markets}
+    # Quoted order id per side, indexed like markets
+    buy_oid: List[Optional[str]] = [None] * len(markets)
+    sell_oid: List[Optional[str]] = [None] * len(markets)
     cycle = 0
     
+    # Book and fee lookups are independent across markets, so fetch them in parallel
+    # Workers start lazily from the loop thread, so steer them off its core
+    # and its real-time priority
+    other_cpus = None
+    if pin_core is not None and hasattr(os, "sched_getaffinity"):
+        other_cpus = os.sched_getaffinity(0) - {pin_core} or None
+    io_pool = ThreadPoolExecutor(
+        max_workers=min(MAX_IO_WORKERS, max(1, len(markets))),
+        initializer=init_io_worker if pin_core is not None else None,
+        initargs=(other_cpus,) if pin_core is not None else (),
+    )
+    
+    mgr = OrderManager(client, rebate_rate=MAKER_REBATE_RATE, io_pool=io_pool)
+    check_fills, position, net_exposure = mgr.check_fills, mgr.position, mgr.net_exposure
+    
+    def fetch_market_data(mkt: Market):
+        return client.get_orderbook(mkt.tokens[0]), client.get_fee_rate(mkt.tokens[0])
+    
+    # Per-cycle output is collected and handed to a writer thread in one
+    # piece, so a slow terminal never holds up the trading loop
+    buf: List[str] = []
+    out = buf.append
+    log_q: queue.SimpleQueue = queue.SimpleQueue()
+    
+    def write_log():
+        while (text := log_q.get()) is not None:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+    
+    log_writer = threading.Thread(target=write_log, daemon=True)
+    log_writer.start()
+    
+    if pin_core is not None:
+        if pin_thread({pin_core}):
+            print(f"  Pinned to core {pin_core} | Scheduling: {make_realtime()}")
+        else:
+            print(f"  Could not pin to core {pin_core}, running unpinned")
+    
     try:
         while True:
             cycle += 1
-            print(f"  Cycle {cycle} | Placed: {mgr.placed} | Filled: {mgr.filled_count}")
+            cycle_start = time.monotonic()
+            deadline = cycle_start + CYCLE_PERIOD_S
+            out(f"  Cycle {cycle} | Placed: {mgr.placed} | Filled: {mgr.filled_count}")
             
             stale = mgr.cancel_stale(lifetime)
             if stale:
-                print(f"  Cancelled {stale} stale")
+                out(f"  Cancelled {stale} stale")
             
+            # Fill checks may wait on REST trade lookups, so run them all
+            # before the books are fetched and the quote budget starts
             for mkt in markets:
-                book = client.get_orderbook(mkt.tokens[0])
-                fee = client.get_fee_rate(mkt.tokens[0])
+                for f in check_fills(mkt):
+                    out(f"  {f['side']} {f['filled_qty']:.2f} @ {f['filled_price']:.4f} | +${f['rebate']:.4f}")
+            
+            market_data = list(io_pool.map(fetch_market_data, markets))
+            mids = {m.condition_id: book.midpoint for m, (book, _) in zip(markets, market_data)}
+            quote_deadline = time.monotonic() + MAX_QUOTE_LATENCY_MS / 1000
+            # Start one market later each cycle so a spent quote budget
+            # doesn't always fall on the same tail markets
+            first = cycle % len(markets) if markets else 0
+            
+            for seen, i in enumerate(itertools.chain(range(first, len(markets)), range(first))):
+                mkt = markets[i]
+                book, fee = market_data[i]
                 
-                for f in mgr.check_fills(mkt):
-                    print(f"  {f['side']} {f['filled_qty']:.2f} @ {f['filled_price']:.4f} | +${f['rebate']:.4f}")
+                # Books this old are stale; leave quoting the remaining
+                # markets to the next cycle
+                if time.monotonic() > quote_deadline:
+                    out(f"  Quote budget spent, not quoting {len(markets) - seen} markets")
+                    break
                 
-                inv = mgr.inventory.get(mkt.condition_id, {"YES": 0.0, "NO": 0.0})
-                yes_q, no_q = inv["YES"], inv["NO"]
+                yes_q, no_q = position(mkt.condition_id)
                 yes_v, no_v = yes_q * book.midpoint, no_q * book.midpoint
                 
-                net_exp = mgr.net_exposure(markets)
+                net_exp = net_exposure(mids)
                 if abs(net_exp) > max_net:
-                    print(f"  Max net exposure: ${net_exp:.2f}")
+                    out(f"  Max net exposure: ${net_exp:.2f}")
                     continue
                 if yes_v > max_per_mkt or no_v > max_per_mkt:
-                    print(f"  Max per-market")
+                    out(f"  Max per-market")
                     continue
                 
-                bid = book.bids[0]["price"] if book.bids else 0.50
+                bid = book.bid_prices[0] if book.bid_prices else 0.50
                 token_qty = order_size_usd / bid if bid > 0 else 0
                 
                 # Calculate inventory skew
-                skew = (yes_v - no_v) / (capital + 1)
+                skew = (yes_v - no_v) / skew_denom
                 
                 # Calculate optimal spread using new pricing engine
                 fill_rate = mgr.filled_count / mgr.placed if mgr.placed > 0 else 0.20
@@ -939,60 +1704,93 @@ def main():
                     market_spread_bps=book.spread_bps,
                     volatility_bps=0.5,  # Placeholder for real volatility calc
                     fill_rate=fill_rate,
+                    config=pricing_cfg,
                 )
                 
                 # If spread is 0, market is too tight for rebates - skip quoting
                 if spread_bps <= 0:
-                    print(f"  Market spread too tight ({book.spread_bps:.0f} bps < {TARGET_REBATE_BPS} bps rebate threshold)")
+                    out(f"  Market spread too tight ({book.spread_bps:.0f} bps < {TARGET_REBATE_BPS} bps rebate threshold)")
                     continue
                 
                 # Calculate adaptive positioning based on skew
-                positioning = calculate_positioning_factor(skew, spread_bps)
+                positioning = calculate_positioning_factor(skew, spread_bps, pricing_cfg)
                 
                 # Calculate quote prices
                 buy_p, sell_p = calculate_quote_prices(book.midpoint, spread_bps, positioning, skew)
                 
                 if buy_p is None or sell_p is None:
-                    print(f"  Invalid prices calculated, skipping")
+                    out(f"  Invalid prices calculated, skipping")
                     continue
                 
-                print(f"  {mkt.question[:50]}")
-                print(f"  {book.midpoint:.4f} | Spread: {spread_bps} bps | ${mkt.volume_24h:,.0f}")
-                print(f"  {yes_q:.2f}/{no_q:.2f} | Skew: {skew*100:.0f}% | Fee: {fee/100:.2f}%")
+                out(f"  {mkt.question[:50]}")
+                out(f"  {book.midpoint:.4f} | Spread: {spread_bps} bps | ${mkt.volume_24h:,.0f}")
+                out(f"  {yes_q:.2f}/{no_q:.2f} | Skew: {skew*100:.0f}% | Fee: {fee/100:.2f}%")
                 
-                # One-sided quoting: Check if we should quote each side
-                can_buy = should_quote_side("BUY", skew) and yes_v + order_size_usd <= max_inv_usd
-                can_sell = should_quote_side("SELL", skew) and no_v + order_size_usd <= max_inv_usd
+                # One-sided quoting: stop adding to the overrepresented side
+                can_buy = skew <= buy_stop and yes_v <= inv_room
+                can_sell = skew >= sell_stop and no_v <= inv_room
                 
-                if can_buy and not open_orders[mkt.condition_id]["BUY"]:
-                    o = mgr.submit_order(mkt, OrderSide.BUY, buy_p, token_qty, fee, lifetime)
-                    if o:
-                        open_orders[mkt.condition_id]["BUY"] = o.order_id
-                        print(f"  BUY {token_qty:.2f} @ {buy_p:.4f}")
-                        if hasattr(client, 'subscribe_token'):
-                            client.subscribe_token(mkt.tokens[0])
+                if can_buy and not buy_oid[i]:
+                    quotes.append((mkt, OrderSide.BUY, buy_p, token_qty, fee, lifetime))
+                    quote_idx.append(i)
                 
-                if can_sell and not open_orders[mkt.condition_id]["SELL"]:
-                    o = mgr.submit_order(mkt, OrderSide.SELL, sell_p, token_qty, fee, lifetime)
-                    if o:
-                        open_orders[mkt.condition_id]["SELL"] = o.order_id
-                        print(f"  SELL {token_qty:.2f} @ {sell_p:.4f}")
-                        if hasattr(client, 'subscribe_token'):
-                            client.subscribe_token(mkt.tokens[1])
+                if can_sell and not sell_oid[i]:
+                    quotes.append((mkt, OrderSide.SELL, sell_p, token_qty, fee, lifetime))
+                    quote_idx.append(i)
+            
+            if quotes:
+                for (_, side, price, qty, _, _), i, o in zip(quotes, quote_idx, mgr.submit_orders(quotes)):
+                    if o is None:
+                        continue
+                    if side is OrderSide.BUY:
+                        buy_oid[i] = o.order_id
+                    else:
+                        sell_oid[i] = o.order_id
+                    out(f"  {side.value} {qty:.2f} @ {price:.4f}")
+                    new_tokens.append(o.token_id)
+                quotes.clear()
+                quote_idx.clear()
+            
+            if new_tokens:
+                if can_subscribe:
+                    client.subscribe_tokens(new_tokens)
+                new_tokens.clear()
             
             if cycle % 5 == 0:
                 rate = mgr.filled_count / mgr.placed * 100 if mgr.placed > 0 else 0
                 net = -mgr.gas_spent
-                print(f"  {mgr.filled_count}/{mgr.placed} fills ({rate:.0f}%)")
-                print(f"  Gas: ${mgr.gas_spent:.4f} | Net: ${net:.4f}")
-                print(f"  Exp: ${net_exp:.2f} | Yield: {(net/capital)*100:.2f}%")
+                out(f"  {mgr.filled_count}/{mgr.placed} fills ({rate:.0f}%)")
+                out(f"  Gas: ${mgr.gas_spent:.4f} | Net: ${net:.4f}")
+                out(f"  Exp: ${net_exposure(mids):.2f} | Yield: {(net/capital)*100:.2f}%")
             
-            time.sleep(3)
+            # Surface cycles that no longer fit in the period
+            overrun = time.monotonic() - deadline
+            if overrun > 0:
+                out(f"  Cycle overran by {overrun * 1000:.0f} ms")
+            
+            if buf:
+                log_q.put("\n".join(buf) + "\n")
+                buf.clear()
+            
+            # Sleep until the feed reports a move or a fill, or until the
+            # cycle period is up counting the time this cycle already took.
+            # Busy markets wake constantly, so hold a minimum period and let
+            # wakeups that land in the meantime coalesce into the next cycle
+            client.wake.wait(timeout=max(0.0, deadline - time.monotonic()))
+            time.sleep(max(0.0, cycle_start + MIN_CYCLE_PERIOD_S - time.monotonic()))
+            client.wake.clear()
     
     except KeyboardInterrupt:
-        if hasattr(client, 'stop_ws'):
+        if buf:
+            log_q.put("\n".join(buf) + "\n")
+        # Let the writer drain before the summary is printed
+        log_q.put(None)
+        log_writer.join(timeout=2.0)
+        io_pool.shutdown(wait=False)
+        if hasattr(client, 'close'):
+            client.close()
+        elif hasattr(client, 'stop_ws'):
             client.stop_ws()
-        pass
     
     total_rebates = sum(o.filled_qty * o.filled_price * 156 / 10000 * MAKER_REBATE_RATE for o in mgr.filled)
     net = total_rebates - mgr.gas_spent
@@ -16,7 +16,7 @@ import logging
 import random
 import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 
 # Configure logging
 logging.basicConfig(
@@ -25,55 +25,68 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class SampleMarket(NamedTuple):
+    """A simulated market; order_size is filled in at discovery."""
+    
+    condition_id: str
+    question: str
+    token_ids: Tuple[str, ...]
+    fee_rate_bps: int
+    volume_24h: int
+    liquidity: int
+    order_size: float = 10.0
+
+
 # Sample 15-minute crypto markets (realistic simulation)
-SAMPLE_MARKETS = [
-    {
-        "condition_id": "0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
-        "question": "Will BTC be above $100,000 by Jan 31, 2025?",
-        "token_ids": ["0xyes1", "0xno1"],
-        "fee_rate_bps": 156,  # 1.56% fee = good rebates
-        "volume_24h": 15000,
-        "liquidity": 5000,
-    },
-    {
-        "condition_id": "0x234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1",
-        "question": "Will ETH close above $3,500 on Jan 15?",
-        "token_ids": ["0xyes2", "0xno2"],
-        "fee_rate_bps": 100,
-        "volume_24h": 12000,
-        "liquidity": 4000,
-    },
-    {
-        "condition_id": "0x34567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef12",
-        "question": "Will SOL exceed $200 in the next 24h?",
-        "token_ids": ["0xyes3", "0xno3"],
-        "fee_rate_bps": 200,
-        "volume_24h": 8000,
-        "liquidity": 3000,
-    },
-    {
-        "condition_id": "0x4567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef123",
-        "question": "Will BTC dip below $90,000 before Jan 20?",
-        "token_ids": ["0xyes4", "0xno4"],
-        "fee_rate_bps": 180,
-        "volume_24h": 20000,
-        "liquidity": 8000,
-    },
-    {
-        "condition_id": "0x567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234",
-        "question": "Will meme coins outperform BTC this week?",
-        "token_ids": ["0xyes5", "0xno5"],
-        "fee_rate_bps": 156,
-        "volume_24h": 5000,
-        "liquidity": 1500,
-    },
-]
+SAMPLE_MARKETS: Tuple[SampleMarket, ...] = (
+    SampleMarket(
+        condition_id="0x1234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef",
+        question="Will BTC be above $100,000 by Jan 31, 2025?",
+        token_ids=("0xyes1", "0xno1"),
+        fee_rate_bps=156,  # 1.56% fee = good rebates
+        volume_24h=15000,
+        liquidity=5000,
+    ),
+    SampleMarket(
+        condition_id="0x234567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1",
+        question="Will ETH close above $3,500 on Jan 15?",
+        token_ids=("0xyes2", "0xno2"),
+        fee_rate_bps=100,
+        volume_24h=12000,
+        liquidity=4000,
+    ),
+    SampleMarket(
+        condition_id="0x34567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef12",
+        question="Will SOL exceed $200 in the next 24h?",
+        token_ids=("0xyes3", "0xno3"),
+        fee_rate_bps=200,
+        volume_24h=8000,
+        liquidity=3000,
+    ),
+    SampleMarket(
+        condition_id="0x4567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef123",
+        question="Will BTC dip below $90,000 before Jan 20?",
+        token_ids=("0xyes4", "0xno4"),
+        fee_rate_bps=180,
+        volume_24h=20000,
+        liquidity=8000,
+    ),
+    SampleMarket(
+        condition_id="0x567890abcdef1234567890abcdef1234567890abcdef1234567890abcdef1234",
+        question="Will meme coins outperform BTC this week?",
+        token_ids=("0xyes5", "0xno5"),
+        fee_rate_bps=156,
+        volume_24h=5000,
+        liquidity=1500,
+    ),
+)
 
 
 class QuoteEngine:
     """Calculate quotes based on market conditions."""
     
-    def __init__(self, settings: Dict[str, Any]):
+    def __init__(self, settings: Dict[str, Any], rng: Optional[random.Random] = None):
+        self.rng = rng or random.Random()
         self.min_spread_bps = settings.get("MIN_SPREAD_BPS", 3)
         self.max_spread_bps = settings.get("MAX_SPREAD_BPS", 15)
         self.best_bid_offset_bps = settings.get("BEST_BID_OFFSET_BPS", 1)
@@ -82,14 +95,14 @@ class QuoteEngine:
     
     def calculate_quotes(
         self,
-        market: Dict[str, Any],
+        market: SampleMarket,
         mid_price: float,
         inventory: Dict[str, float],
     ) -> tuple[Optional[Dict], Optional[Dict]]:
         """Generate BUY and SELL quotes."""
         
         # Calculate spread
-        spread_bps = random.randint(self.min_spread_bps, self.max_spread_bps)
+        spread_bps = self.rng.randint(self.min_spread_bps, self.max_spread_bps)
         spread = spread_bps / 10000
         
         # Generate quotes around mid price
@@ -110,23 +123,23 @@ class QuoteEngine:
             else:
                 ask_price = round(ask_price + 0.01, 4)
         
-        yes_token = market["token_ids"][0]
-        no_token = market["token_ids"][1] if len(market["token_ids"]) > 1 else None
+        yes_token = market.token_ids[0]
+        no_token = market.token_ids[1] if len(market.token_ids) > 1 else None
         
         return (
             {
                 "token_id": yes_token,
                 "side": "BUY",
                 "price": bid_price,
-                "size": market.get("order_size", 10.0),
-                "fee_rate": market.get("fee_rate_bps", 156),
+                "size": market.order_size,
+                "fee_rate": market.fee_rate_bps,
             },
             {
                 "token_id": no_token,
                 "side": "SELL",
                 "price": ask_price,
-                "size": market.get("order_size", 10.0),
-                "fee_rate": market.get("fee_rate_bps", 156),
+                "size": market.order_size,
+                "fee_rate": market.fee_rate_bps,
             } if no_token else None,
         )
 
@@ -214,11 +227,13 @@ class MarketMakerBot:
                 "MAX_INVENTORY_SKEW": 0.15,
             }
         
-        self.quote_engine = QuoteEngine(self.settings)
+        # Own generator rather than the shared, locked module-level one
+        self.rng = random.Random()
+        self.quote_engine = QuoteEngine(self.settings, self.rng)
         self.risk_manager = RiskManager(self.settings)
         self.inventory: Dict[str, float] = {"YES": 0, "NO": 0}
         self.exposure = 0.0
-        self.active_markets: List[Dict] = []
+        self.active_markets: List[SampleMarket] = []
     
     async def start(self):
         """Start the bot."""
@@ -242,15 +257,14 @@ class MarketMakerBot:
         print("\n🔍 Discovering markets...")
         await asyncio.sleep(0.5)
         
-        self.active_markets = SAMPLE_MARKETS.copy()
-        for m in self.active_markets:
-            m["order_size"] = self.settings["DEFAULT_SIZE"]
+        size = self.settings["DEFAULT_SIZE"]
+        self.active_markets = [m._replace(order_size=size) for m in SAMPLE_MARKETS]
         
         print(f"   Found {len(self.active_markets)} eligible markets")
         for m in self.active_markets:
-            q = m["question"][:50] + "..." if len(m["question"]) > 50 else m["question"]
+            q = m.question[:50] + "..." if len(m.question) > 50 else m.question
             print(f"   • {q}")
-            print(f"     Fee: {m['fee_rate_bps']} bps | 24h Vol: ${m['volume_24h']:,}")
+            print(f"     Fee: {m.fee_rate_bps} bps | 24h Vol: ${m.volume_24h:,}")
         
         print("\n" + "-" * 60)
         print("\n🚀 Starting quote loop (Ctrl+C to stop)...")
@@ -261,6 +275,7 @@ class MarketMakerBot:
     async def _main_loop(self):
         """Main trading loop."""
         cycle = 0
+        rng = self.rng
         
         while True:
             try:
@@ -269,7 +284,7 @@ class MarketMakerBot:
                 
                 for i, market in enumerate(self.active_markets):
                     # Simulate getting current price from orderbook
-                    mid_price = round(random.uniform(0.30, 0.70), 4)
+                    mid_price = round(rng.uniform(0.30, 0.70), 4)
                     
                     # Calculate quotes
                     buy_quote, sell_quote = self.quote_engine.calculate_quotes(
@@ -287,11 +302,11 @@ class MarketMakerBot:
                         )
                         if allowed:
                             # Simulate fill (50% chance in test mode)
-                            if random.random() > 0.5:
+                            if rng.random() > 0.5:
                                 self.inventory["YES"] += buy_quote["size"] * buy_quote["price"]
                                 self.exposure += buy_quote["size"]
                                 rebate = buy_quote["size"] * buy_quote["price"] * buy_quote["fee_rate"] / 10000
-                                print(f"\n  📈 {market['token_ids'][0][:12]}... BUY  ${buy_quote['size']:.2f} @ {buy_quote['price']}")
+                                print(f"\n  📈 {market.token_ids[0][:12]}... BUY  ${buy_quote['size']:.2f} @ {buy_quote['price']}")
                                 print(f"     ✅ FILLED! Est. rebate: ${rebate:.4f}")
                     
                     # Check risk for SELL
@@ -304,11 +319,11 @@ class MarketMakerBot:
                             self.inventory,
                         )
                         if allowed:
-                            if random.random() > 0.5:
+                            if rng.random() > 0.5:
                                 self.inventory["NO"] += sell_quote["size"] * sell_quote["price"]
                                 self.exposure -= sell_quote["size"]
                                 rebate = sell_quote["size"] * sell_quote["price"] * sell_quote["fee_rate"] / 10000
-                                print(f"\n  📉 {market['token_ids'][1][:12]}... SELL ${sell_quote['size']:.2f} @ {sell_quote['price']}")
+                                print(f"\n  📉 {market.token_ids[1][:12]}... SELL ${sell_quote['size']:.2f} @ {sell_quote['price']}")
                                 print(f"     ✅ FILLED! Est. rebate: ${rebate:.4f}")
                 
                 # Brief pause between cycles
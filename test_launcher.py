@@ -5,62 +5,89 @@ import asyncio
 import os
 import sys
 from pathlib import Path
+from typing import NamedTuple
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+
+class Preset(NamedTuple):
+    name: str
+    desc: str
+    order_pct: float
+    min_spread_bps: int
+    max_spread_bps: int
+
+
 # Simple test without API calls
 AGGRO_PRESETS = {
-    "1": {"name": "Conservative", "desc": "Low risk", "order_pct": 0.15, "min_spread_bps": 20, "max_spread_bps": 100},
-    "2": {"name": "Moderate", "desc": "Balanced", "order_pct": 0.25, "min_spread_bps": 10, "max_spread_bps": 50},
-    "3": {"name": "Aggressive", "desc": "High risk", "order_pct": 0.35, "min_spread_bps": 3, "max_spread_bps": 15},
+    "1": Preset("Conservative", "Low risk", 0.15, 20, 100),
+    "2": Preset("Moderate", "Balanced", 0.25, 10, 50),
+    "3": Preset("Aggressive", "High risk", 0.35, 3, 15),
 }
 
+MARKETS = ("BTC", "ETH", "SOL")
+EQ = "=" * 60
+
+# Static prompt transcript, built once at import
+INTRO = "\n".join([
+    EQ,
+    "  POLYMR - Market Making Bot",
+    EQ,
+    "\n💰 Starting capital (USD) [60]: 60",
+    "\n🎯 Aggression Level:",
+    "  1. Conservative - Low risk",
+    "  2. Moderate - Balanced",
+    "  3. Aggressive - High risk",
+    "\nChoice: 3",
+    "\n🔒 SANDBOX - Use real data, no real trades",
+    "🚀 REAL    - Execute real trades",
+    "\nChoice: 1 (sandbox)",
+])
+CONFIG_HEADER = f"\n{EQ}\n  CONFIGURATION\n{EQ}"
+SUMMARY_HEADER = f"\n{EQ}\n  SUMMARY\n{EQ}"
+REBATE_PER_PRICE = 21 * 0.0156  # $21 order at a 1.56% fee
+
+# Fixed preview bids, one row per cycle (varied but reproducible)
+SAMPLE_BIDS = (
+    (0.6344, 0.6258, 0.5921),
+    (0.5759, 0.6011, 0.5905),
+    (0.6284, 0.5803, 0.5977),
+)
+
 def test_prompts():
-    print("=" * 60)
-    print("  POLYMR - Market Making Bot")
-    print("=" * 60)
-    print("\n💰 Starting capital (USD) [60]: 60")
-    print("\n🎯 Aggression Level:")
-    print("  1. Conservative - Low risk")
-    print("  2. Moderate - Balanced")  
-    print("  3. Aggressive - High risk")
-    print("\nChoice: 3")
-    print("\n🔒 SANDBOX - Use real data, no real trades")
-    print("🚀 REAL    - Execute real trades")
-    print("\nChoice: 1 (sandbox)")
+    # Collect output lines and write them in one go at the end
+    buf = []
+    out = buf.append
+    
+    out(INTRO)
     
     aggro = AGGRO_PRESETS["3"]
     capital = 60
-    order_size = round(capital * aggro["order_pct"], 2)
+    order_size = round(capital * aggro.order_pct, 2)
+    
+    out(CONFIG_HEADER)
+    out(f"\n  Capital:      ${capital}")
+    out(f"  Order Size:   ${order_size}")
+    out(f"  Spread:       {aggro.min_spread_bps}-{aggro.max_spread_bps} bps")
+    out(f"  Mode:         🔒 SANDBOX")
+    out("\nStart bot? [y]: y")
+    out(EQ)
     
-    print("\n" + "=" * 60)
-    print("  CONFIGURATION")
-    print("=" * 60)
-    print(f"\n  Capital:      ${capital}")
-    print(f"  Order Size:   ${order_size}")
-    print(f"  Spread:       {aggro['min_spread_bps']}-{aggro['max_spread_bps']} bps")
-    print(f"  Mode:         🔒 SANDBOX")
-    print("\nStart bot? [y]: y")
-    print("=" * 60)
+    # Preview a few cycles from the fixed bids
+    total_rebate = REBATE_PER_PRICE * sum(map(sum, SAMPLE_BIDS))
+    for cycle, row in enumerate(SAMPLE_BIDS, 1):
+        out(f"\n🔄 Cycle {cycle}")
+        for mkt, bid in zip(MARKETS, row):
+            out(f"   📈 {mkt} BUY  $21 @ {bid} → +${bid * REBATE_PER_PRICE:.4f}")
     
-    # Simulate a few cycles
-    import random
-    total_rebate = 0
-    for cycle in range(1, 4):
-        print(f"\n🔄 Cycle {cycle}")
-        for mkt in ["BTC", "ETH", "SOL"]:
-            bid = round(random.uniform(0.55, 0.65), 4)
-            rebate = 21 * bid * 0.0156
-            total_rebate += rebate
-            print(f"   📈 {mkt} BUY  $21 @ {bid} → +${rebate:.4f}")
+    out(SUMMARY_HEADER)
+    out(f"\n  Total Rebates:  ${total_rebate:.4f}")
+    out(f"  Yield:          {(total_rebate/capital)*100:.2f}%")
+    out(f"  Est. Daily:     ${total_rebate * 24:.2f}/day")
+    out(EQ)
     
-    print("\n" + "=" * 60)
-    print("  SUMMARY")
-    print("=" * 60)
-    print(f"\n  Total Rebates:  ${total_rebate:.4f}")
-    print(f"  Yield:          {(total_rebate/capital)*100:.2f}%")
-    print(f"  Est. Daily:     ${total_rebate * 24:.2f}/day")
-    print("=" * 60)
+    sys.stdout.write("\n".join(buf) + "\n")
+    sys.stdout.flush()
 
 if __name__ == "__main__":
     test_prompts()
@@ -2,22 +2,36 @@
 """Test script for the new pricing engine."""
 
 import sys
-sys.path.insert(0, '/home/timmy/polymr')
+from itertools import product
+from pathlib import Path
 
-# Import directly to avoid polymr package dependencies
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT))
+
+# Import directly to avoid polymr package dependencies. The loader still
+# reads polymr/__pycache__, and registering the module under a private name
+# lets anything else in the process reuse it without picking up an
+# unrelated "pricing" module
 import importlib.util
-spec = importlib.util.spec_from_file_location("pricing", "/home/timmy/polymr/polymr/pricing.py")
-pricing = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(pricing)
+PRICING_MODULE = "_polymr_pricing_under_test"
+pricing = sys.modules.get(PRICING_MODULE)
+if pricing is None:
+    spec = importlib.util.spec_from_file_location(PRICING_MODULE, ROOT / "polymr" / "pricing.py")
+    pricing = importlib.util.module_from_spec(spec)
+    sys.modules[PRICING_MODULE] = pricing
+    spec.loader.exec_module(pricing)
 
 calculate_optimal_spread = pricing.calculate_optimal_spread
 calculate_positioning_factor = pricing.calculate_positioning_factor
 should_quote_side = pricing.should_quote_side
+should_quote_sides = pricing.should_quote_sides
 calculate_quote_prices = pricing.calculate_quote_prices
 get_aggression_config = pricing.get_aggression_config
 TARGET_REBATE_BPS = pricing.TARGET_REBATE_BPS
 MIN_REBATE_SPREAD_BPS = pricing.MIN_REBATE_SPREAD_BPS
 
+EQ = "=" * 60
+
 
 def test_calculate_optimal_spread():
     """Test spread optimization logic."""
@@ -70,21 +84,23 @@ def test_should_quote_side():
     """Test one-sided quoting logic."""
     print("\n=== Testing should_quote_side ===")
     
-    # Test 1: Normal conditions - can quote both sides
-    assert should_quote_side("BUY", 0.0) == True, "Should quote BUY when balanced"
-    assert should_quote_side("SELL", 0.0) == True, "Should quote SELL when balanced"
-    
-    # Test 2: Skewed YES - shouldn't buy
-    assert should_quote_side("BUY", 0.20) == False, "Should not BUY when YES skewed"
-    assert should_quote_side("SELL", 0.20) == True, "Should still SELL when YES skewed"
-    
-    # Test 3: Skewed NO - shouldn't sell
-    assert should_quote_side("SELL", -0.20) == False, "Should not SELL when NO skewed"
-    assert should_quote_side("BUY", -0.20) == True, "Should still BUY when NO skewed"
-    
-    # Test 4: Threshold testing
-    assert should_quote_side("BUY", 0.14) == True, "Should quote BUY at 14% skew"
-    assert should_quote_side("BUY", 0.16) == False, "Should not quote BUY at 16% skew"
+    # Tests 1-4 as a truth table of (side, skew, expected)
+    cases = [
+        ("BUY", 0.0, True), ("SELL", 0.0, True),      # Balanced - quote both sides
+        ("BUY", 0.20, False), ("SELL", 0.20, True),   # Skewed YES - stop buying
+        ("SELL", -0.20, False), ("BUY", -0.20, True), # Skewed NO - stop selling
+        ("BUY", 0.14, True), ("BUY", 0.16, False),    # Either side of the 15% threshold
+    ]
+    got = [should_quote_side(side, skew) for side, skew, _ in cases]
+    expected = [want for _, _, want in cases]
+    mismatches = [case for case, result in zip(cases, got) if result != case[2]]
+    assert got == expected, f"should_quote_side disagrees on (side, skew, expected): {mismatches}"
+    
+    # Test 5: Batch variant agrees with the scalar one
+    skews = [0.0, 0.20, -0.20, 0.14, 0.16, 0.15, -0.15]
+    can_buy, can_sell = should_quote_sides(skews)
+    assert can_buy == [should_quote_side("BUY", s) for s in skews], "Batch BUY flags should match scalar"
+    assert can_sell == [should_quote_side("SELL", s) for s in skews], "Batch SELL flags should match scalar"
     
     print("  ✓ All one-sided quoting tests passed")
 
@@ -110,6 +126,23 @@ def test_calculate_quote_prices():
     assert buy_skewed > buy, f"Skewed YES ({buy_skewed}) should have more expensive buys than normal ({buy})"
     assert sell_skewed < sell, f"Skewed YES ({sell_skewed}) should have cheaper sells than normal ({sell})"
     
+    # Test 3: Sweep a grid of mids, spreads and skews
+    mids = [round(0.20 + 0.05 * i, 2) for i in range(13)]
+    spreads = range(10, 201, 10)
+    skews = [round(-0.5 + 0.1 * i, 1) for i in range(11)]
+    for mid, spread_bps in product(mids, spreads):
+        quotes = [calculate_quote_prices(mid, spread_bps, 0.5, skew) for skew in skews]
+        for skew, (buy, sell) in zip(skews, quotes):
+            assert 0 < buy < 1 and 0 < sell < 1, f"Bad quotes {buy}/{sell} at mid={mid} spread={spread_bps} skew={skew}"
+            if skew == 0:
+                assert buy < mid < sell, f"Unskewed quotes should straddle mid={mid} at spread={spread_bps}"
+        # Skewing towards YES only ever raises buys and lowers sells
+        buys = [buy for buy, _ in quotes]
+        sells = [sell for _, sell in quotes]
+        assert buys == sorted(buys), f"Buys should rise with skew at mid={mid} spread={spread_bps}"
+        assert sells == sorted(sells, reverse=True), f"Sells should fall with skew at mid={mid} spread={spread_bps}"
+    print(f"  Grid sweep: {len(mids) * len(spreads) * len(skews)} cases")
+    
     print("  ✓ All price calculation tests passed")
 
 
@@ -117,23 +150,21 @@ def test_get_aggression_config():
     """Test aggression configuration."""
     print("\n=== Testing get_aggression_config ===")
     
+    required = frozenset({
+        "pct", "min_spread_bps", "max_spread_bps",
+        "inventory_cap", "buy_stop_threshold", "sell_stop_threshold",
+    })
     for level in ["1", "2", "3"]:
         config = get_aggression_config(level)
-        assert "pct" in config, f"Level {level} missing 'pct'"
-        assert "min_spread_bps" in config, f"Level {level} missing 'min_spread_bps'"
-        assert "max_spread_bps" in config, f"Level {level} missing 'max_spread_bps'"
-        assert "inventory_cap" in config, f"Level {level} missing 'inventory_cap'"
-        assert "buy_stop_threshold" in config, f"Level {level} missing 'buy_stop_threshold'"
-        assert "sell_stop_threshold" in config, f"Level {level} missing 'sell_stop_threshold'"
+        missing = required.difference(config)
+        assert not missing, f"Level {level} missing {sorted(missing)}"
         print(f"  Level {level} ({config['name']}): spread={config['min_spread_bps']}-{config['max_spread_bps']} bps, cap={config['inventory_cap']*100:.0f}%")
     
     print("  ✓ All aggression config tests passed")
 
 
 def main():
-    print("=" * 60)
-    print("  PRICING ENGINE TESTS")
-    print("=" * 60)
+    print(f"{EQ}\n  PRICING ENGINE TESTS\n{EQ}")
     print(f"  Target Rebate: {TARGET_REBATE_BPS} bps")
     print(f"  Min Rebate Spread: {MIN_REBATE_SPREAD_BPS} bps")
     print()
@@ -145,9 +176,7 @@ def main():
         test_calculate_quote_prices()
         test_get_aggression_config()
         
-        print("\n" + "=" * 60)
-        print("  ✓ ALL TESTS PASSED")
-        print("=" * 60)
+        print(f"\n{EQ}\n  ✓ ALL TESTS PASSED\n{EQ}")
         return 0
     except AssertionError as e:
         print(f"\n✗ Test failed: {e}")
@@ -4,22 +4,23 @@
 import sys
 
 def ask(prompt, default=None):
-    print(f"ASKING: {prompt} (default: {default})", flush=True)
+    # input() flushes stdout itself before showing the prompt
+    print(f"ASKING: {prompt} (default: {default})")
     if default:
         result = input(f"{prompt} [{default}]: ").strip() or str(default)
     else:
         result = input(f"{prompt}: ").strip()
-    print(f"GOT: {result}", flush=True)
+    print(f"GOT: {result}")
     return result
 
 def test():
-    print("=" * 40, flush=True)
+    print("=" * 40)
     c = ask("Capital", "60")
-    print(f"Capital = {c}", flush=True)
+    print(f"Capital = {c}")
     
-    print("=" * 40, flush=True)
+    print("=" * 40)
     choice = ask("Choice (1-3)", "2")
-    print(f"Choice = {choice}", flush=True)
+    print(f"Choice = {choice}")
 
 if __name__ == "__main__":
     test()